@@ -0,0 +1,3 @@
+# headless benchmarks, run from the repo root:
+#   python -m benchmarks.bench_logic
+#   python benchmarks/bench_imports.py
@@ -0,0 +1,81 @@
+"""
+Import-time benchmark for headless entry points.
+
+Each target is imported in a fresh interpreter so module caches don't hide the
+real cost. The run fails (exit code 1) if a headless import pulls in the
+renderer (ursina / panda3d / direct) or goes over the time budget.
+
+Usage:
+    python benchmarks/bench_imports.py [--budget-ms 250] [--repeat 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# modules a headless import must never load
+FORBIDDEN = ("ursina", "panda3d", "direct")
+
+# statements that must stay headless-safe
+TARGETS = {
+    "blackjack_logic": "import blackjack_logic",
+    "pwat_vinput": "from painting_on_water import vinput",
+    "pwat_pure_helpers": ("from painting_on_water import vinput, ReverseIndex, DateHelper, "
+                          "ensure_secret_key, hmac_hex"),
+}
+
+# runs inside the child interpreter, prints one json line
+PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - t0
+forbidden = sorted({{m.split('.')[0] for m in sys.modules}} & set({forbidden!r}))
+print(json.dumps({{"seconds": elapsed, "forbidden": forbidden}}))
+"""
+
+
+def probe(stmt: str) -> dict:
+    """run one import statement in a fresh interpreter"""
+    code = PROBE.format(stmt=stmt, forbidden=FORBIDDEN)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                         capture_output=True, text=True)
+    if out.returncode != 0:
+        return {"seconds": float("nan"), "forbidden": [], "error": out.stderr.strip()}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(budget_ms: float, repeat: int) -> int:
+    failed = False
+    for name, stmt in TARGETS.items():
+        runs = [probe(stmt) for _ in range(repeat)]
+        errors = [r["error"] for r in runs if "error" in r]
+        if errors:
+            print(f"FAIL {name}: import error\n{errors[0]}")
+            failed = True
+            continue
+
+        median_ms = statistics.median(r["seconds"] for r in runs) * 1000
+        forbidden = sorted({m for r in runs for m in r["forbidden"]})
+        status = "ok"
+        if forbidden:
+            status = f"FAIL pulled in {', '.join(forbidden)}"
+            failed = True
+        elif median_ms > budget_ms:
+            status = f"FAIL over budget ({budget_ms:.0f} ms)"
+            failed = True
+        print(f"{name:<20} {median_ms:8.2f} ms  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=250.0, help="max median import time")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per target")
+    args = parser.parse_args()
+    sys.exit(run(args.budget_ms, args.repeat))
@@ -0,0 +1,189 @@
+"""
+Benchmarks for the BlackjackLogic hot paths.
+
+Measures ns/op for check_hand, hit, initial_deal and process_turn, and
+rounds/sec for full headless rounds (blackjack_round.Round driven by a
+fixed hit-below-17 policy), on 1 and 8 deck shoes with 1-7 seats.
+Results go to JSON; with --baseline the run fails (exit code 1) when any
+benchmark is slower than the baseline by more than --max-slowdown.
+
+Usage:
+    python -m benchmarks.bench_logic [--out bench.json] [--baseline base.json]
+                                     [--max-slowdown 0.25] [--quick]
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT)) # running as a plain script
+
+from blackjack_logic import BlackjackLogic
+from blackjack_rng import make_rng
+from blackjack_round import BETTING, PLAYER_TURN, Round
+from blackjack_shoe import Shoe
+from blackjack_trace import Tracer
+
+DECKS = (1, 8)
+SEATS = (1, 2, 3, 4, 5, 6, 7)
+
+
+def measure(fn, ops_per_call: int, min_time: float, repeat: int) -> float:
+    """median ns per op, each repeat runs fn until min_time has passed"""
+    samples = []
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter_ns()
+        deadline = start + int(min_time * 1e9)
+        now = start
+        while now < deadline:
+            fn()
+            calls += 1
+            now = time.perf_counter_ns()
+        samples.append((now - start) / (calls * ops_per_call))
+    return statistics.median(samples)
+
+
+def make_table(decks: int, seats: int, seed: int = 0) -> BlackjackLogic:
+    table = BlackjackLogic(rng=make_rng("fast", seed), tracer=Tracer()) # all trace categories off
+    table.deck = Shoe(decks, rng=table.rng)
+    for seat in range(seats):
+        table.seat_player(f"P{seat}", 1e12)
+    table.seat_dealer("Dealer")
+    return table
+
+
+def refill(table: BlackjackLogic, need: int):
+    """reshuffle the shoe when fewer than `need` cards are left"""
+    if len(table.deck) < need:
+        table.deck.shuffle()
+
+
+def make_round(table: BlackjackLogic) -> Round:
+    """blackjack_round.Round over the table's seats, the path the game, server and bots run"""
+    return Round(table, table.players, table.dealer)
+
+
+def play_round(game: Round):
+    """one headless round through Round.step: bet 1, hit below 17, stand"""
+    deck = game.deck
+    if not deck.reshuffle_if_cut():
+        refill(game.logic, 12 * (len(game.players) + 1))
+    while game.state == BETTING:
+        game.step(1.0)
+    while game.state == PLAYER_TURN:
+        game.step("hit" if game.current.score < 17 else "stand")
+    game.new_round()
+
+
+def run_all(min_time: float, repeat: int) -> dict:
+    results = {}
+
+    def record(name, ns_per_op, unit="op"):
+        results[name] = {"ns_per_op": ns_per_op, f"{unit}s_per_sec": 1e9 / ns_per_op}
+        print(f"{name:<32} {ns_per_op:12.1f} ns/{unit}  {1e9 / ns_per_op:14,.0f} {unit}s/s")
+
+    table = make_table(1, 1)
+    two_cards = ["QH", "6S"]
+    five_cards = ["2H", "AS", "3D", "AC", "4S"]
+    record("check_hand/2", measure(lambda: table.check_hand(two_cards), 1, min_time, repeat))
+    record("check_hand/5", measure(lambda: table.check_hand(five_cards), 1, min_time, repeat))
+
+    for decks in DECKS:
+        table = make_table(decks, 1)
+        player = table.players[0]
+
+        def hit_once():
+            refill(table, 1)
+            if len(player.cards) > 10:
+                player.cards.clear()
+            table.hit(player, table.deck)
+        record(f"hit/{decks}d", measure(hit_once, 1, min_time, repeat))
+
+        def turn_once():
+            refill(table, 2)
+            player.reset()
+            table.hit(player, table.deck, 2)
+            table.process_turn(player)
+        record(f"hit2+process_turn/{decks}d", measure(turn_once, 1, min_time, repeat))
+
+    for decks in DECKS:
+        for seats in SEATS:
+            table = make_table(decks, seats)
+
+            def deal_once():
+                refill(table, 2 * (seats + 1))
+                for seat in table.players:
+                    seat.reset()
+                table.dealer.reset()
+                table.initial_deal(table.players, table.dealer, table.deck)
+            record(f"initial_deal/{decks}d/{seats}s", measure(deal_once, 1, min_time, repeat))
+
+    for decks in DECKS:
+        for seats in SEATS:
+            game = make_round(make_table(decks, seats))
+            record(f"round/{decks}d/{seats}s", measure(lambda: play_round(game), 1, min_time, repeat), "round")
+
+    return results
+
+
+def compare(results: dict, baseline: dict, max_slowdown: float) -> list[str]:
+    """names of benchmarks slower than baseline * (1 + max_slowdown)"""
+    failures = []
+    for name, base in baseline.get("results", {}).items():
+        current = results.get(name)
+        if current is None:
+            continue
+        ratio = current["ns_per_op"] / base["ns_per_op"]
+        if ratio > 1 + max_slowdown:
+            failures.append(f"{name}: {ratio:.2f}x slower ({base['ns_per_op']:.1f} -> {current['ns_per_op']:.1f} ns)")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=0.25,
+                        help="allowed fractional slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="short run, for smoke checks")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.min_time, args.repeat = 0.02, 3
+
+    results = run_all(args.min_time, args.repeat)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "min_time": args.min_time,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+        print(f"\nsaved {args.out}")
+
+    if args.baseline:
+        failures = compare(results, json.loads(args.baseline.read_text()), args.max_slowdown)
+        if failures:
+            print("\nSLOWDOWNS:\n  " + "\n  ".join(failures))
+            return 1
+        print(f"\nno slowdowns over {args.max_slowdown:.0%} vs {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Benchmark for the multi-table server.
+
+Measures memory per idle table (tables with a seated player waiting on a
+bet, built directly, no sockets) and action round-trip latency through a
+real localhost connection while those tables sit idle in the same process.
+
+Usage:
+    python -m benchmarks.bench_server [--tables 5000] [--rounds 500]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT)) # running as a plain script
+
+from blackjack_rng import make_rng
+from blackjack_server import TableServer
+
+
+def seat_idle_tables(server: TableServer, count: int) -> float:
+    """fill `count` tables with one player waiting to bet, returns bytes per table"""
+    sink = [].append # events go nowhere
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        server.table(f"idle{i}").join(f"p{i}", 1000, sink)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / count
+
+
+async def action_latency(server: TableServer, rounds: int) -> list[float]:
+    """seconds from sending each bet / action line to reading the reply"""
+    await server.start("127.0.0.1", 0)
+    port = server.server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def request(message: dict, until: str) -> float:
+        start = time.perf_counter()
+        writer.write(json.dumps(message).encode() + b"\n")
+        while True:
+            event = json.loads(await reader.readline())
+            if event["event"] in until:
+                return time.perf_counter() - start
+
+    samples = []
+    await request({"op": "join", "table": "live", "name": "bench", "budget": 1e12}, ("joined",))
+    for _ in range(rounds):
+        samples.append(await request({"op": "bet", "amount": 1}, ("turn", "result")))
+        samples.append(await request({"op": "action", "action": "stand"}, ("result",)))
+
+    writer.close()
+    await writer.wait_closed()
+    await asyncio.sleep(0.01) # let the server side see the EOF
+    server.server.close()
+    await server.server.wait_closed()
+    return samples
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tables", type=int, default=5000, help="idle tables to host")
+    parser.add_argument("--rounds", type=int, default=500, help="rounds for the latency run")
+    args = parser.parse_args(argv)
+
+    server = TableServer(rng=make_rng("fast", 0))
+    per_table = seat_idle_tables(server, args.tables)
+    print(f"idle tables      {args.tables:>10,}")
+    print(f"memory / table   {per_table / 1024:>10.1f} KiB")
+
+    samples = sorted(asyncio.run(action_latency(server, args.rounds)))
+    print(f"round trips      {len(samples):>10,}")
+    print(f"latency p50      {statistics.median(samples) * 1e3:>10.3f} ms")
+    print(f"latency p99      {samples[int(len(samples) * 0.99)] * 1e3:>10.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
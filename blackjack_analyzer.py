@@ -0,0 +1,169 @@
+"""
+Composition-dependent EV analyzer.
+
+Answers "best action for this exact hand against this exact shoe" for live
+BlackjackLogic decisions. The unseen cards (shoe + dealer hole card) are
+packed into one int, 8 bits per value count (blackjack_dealer.pack_shoe), and
+every sub-result is cached in a dict keyed by that int plus the hand, so
+drawing a card is a subtraction and a cache key at the same time.
+
+Two modes:
+    exact=False (default) - dealer outcome probabilities are taken once per
+        decision, from the shoe as it is when the player decides; the
+        player's own draws still deplete the shoe exactly. This is the usual
+        composition-dependent approximation, and it is what keeps one decision
+        in the low milliseconds on an 8 deck shoe.
+    exact=True - dealer probabilities are recomputed for every shoe the
+        player's draws can leave behind, same numbers as StrategySolver.
+        Sub-results are kept across decisions (up to `cache_size`).
+
+Rules as in StrategySolver: no peek, soft 17 and which hands may double
+(after a hit too) come from `rules`. decide() also respects the table's
+double restrictions and money for the first decision.
+"""
+from blackjack_dealer import COUNT_BITS, COUNT_MASK, VALUES, DealerOutcomes, pack_shoe
+from blackjack_rules import Rules, compile_rules
+from blackjack_strategy import card_value, shoe_composition
+
+
+class CompositionAnalyzer:
+    """
+    Args:
+        exact: Recompute dealer odds for every shoe the player can reach.
+        dealer: Shared DealerOutcomes engine (and its LRU), a new one by default.
+        cache_size: Max cached hand nodes in exact mode, cleared when exceeded.
+        rules: Table rules, the dealer engine's (or Rules()) by default.
+    """
+    def __init__(self, exact: bool = False, dealer: DealerOutcomes | None = None,
+                 cache_size: int = 2_000_000, rules: Rules | None = None):
+        if rules is None:
+            rules = dealer.rules if dealer is not None else Rules()
+        self.rules = rules
+        self.exact = exact
+        self.dealer = dealer if dealer is not None else DealerOutcomes(rules=rules)
+        if self.dealer.rules.hit_soft_17 != rules.hit_soft_17:
+            raise ValueError(f"Expected a dealer engine with hit_soft_17={rules.hit_soft_17}, "
+                             f"got {self.dealer.rules.hit_soft_17}")
+        self._double_after_hit = compile_rules(rules).double_ok[False]
+        self.cache_size = cache_size
+        self._memo = {}   # exact mode nodes, kept across decisions
+        self._rows = {}   # exact mode stand rows by (packed, up)
+
+    # ---- stand values -----------------------------------------------------
+    def stand_row(self, up: int, packed: int) -> list[float]:
+        """EV of standing on each total 0..21 against upcard `up`, hole card in `packed`"""
+        p17, p18, p19, p20, p21, bust = self.dealer.outcomes(up, packed)
+        row = [bust - (p17 + p18 + p19 + p20 + p21)] * 17 # under 17 only wins on a dealer bust
+        row.append(bust - (p18 + p19 + p20 + p21))                 # 17
+        row.append(bust + p17 - (p19 + p20 + p21))                 # 18
+        row.append(bust + p17 + p18 - (p20 + p21))                 # 19
+        row.append(bust + p17 + p18 + p19 - p21)                   # 20
+        row.append(bust + p17 + p18 + p19 + p20)                   # 21
+        return row
+
+    def _exact_row(self, up: int, packed: int) -> list[float]:
+        key = (packed << 4) | up
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = self.stand_row(up, packed)
+        return row
+
+    # ---- recursion ----------------------------------------------------------
+    def _best(self, hard, ace, up, packed, left, row, memo) -> float:
+        """value of a hand that can still stand / hit / double"""
+        key = (packed << 10) | (up << 6) | (hard << 1) | ace
+        value = memo.get(key)
+        if value is not None:
+            return value
+        if row is None:
+            stand = self._exact_row(up, packed)
+        else:
+            stand = row
+        total = hard + 10 if ace and hard <= 11 else hard
+        value = stand[total]
+        if total < 21 and left:
+            hit, double = self._draws(hard, ace, up, packed, left, row, memo)
+            if hit > value:
+                value = hit
+            if double > value and self._double_after_hit[total]: # per the rules
+                value = double
+        memo[key] = value
+        return value
+
+    def _draws(self, hard, ace, up, packed, left, row, memo) -> tuple[float, float]:
+        """(hit EV, double EV) from one more card"""
+        hit = double = 0.0
+        for value in range(VALUES):
+            count = (packed >> (COUNT_BITS * value)) & COUNT_MASK
+            if not count:
+                continue
+            weight = count / left
+            new_hard = hard + value + 1
+            if new_hard > 21:
+                hit -= weight
+                double -= weight
+                continue
+            new_ace = ace or not value
+            new_packed = packed - (1 << (COUNT_BITS * value))
+            stand = row if row is not None else self._exact_row(up, new_packed)
+            hit += weight * self._best(new_hard, new_ace, up, new_packed, left - 1, row, memo)
+            double += weight * stand[new_hard + 10 if new_ace and new_hard <= 11 else new_hard]
+        return hit, 2.0 * double
+
+    # ---- queries ------------------------------------------------------------
+    def action_evs(self, hard: int, ace: bool, up: int, shoe: tuple | int) -> dict:
+        """
+        EV per action for one hand.
+
+        Args:
+            hard, ace: Player hand, aces counted as 1, and whether it holds one.
+            up: Dealer upcard value index (0 = ace ... 9 = ten).
+            shoe: Unseen cards (shoe + hole card) as value counts or pack_shoe() key.
+        """
+        packed = shoe if isinstance(shoe, int) else pack_shoe(shoe)
+        left = sum((packed >> (COUNT_BITS * value)) & COUNT_MASK for value in range(VALUES))
+        ace = int(bool(ace))
+        if self.exact:
+            if len(self._memo) > self.cache_size:
+                self._memo.clear()
+                self._rows.clear()
+            row, memo = None, self._memo
+            stand = self._exact_row(up, packed)
+        else:
+            row, memo = self.stand_row(up, packed), {}
+            stand = row
+
+        total = hard + 10 if ace and hard <= 11 else hard
+        if total >= 21 or not left:
+            return {"stand": stand[min(total, 21)] if hard <= 21 else -1.0, "hit": -1.0, "double": -2.0}
+        hit, double = self._draws(hard, ace, up, packed, left, row, memo)
+        return {"stand": stand[total], "hit": hit, "double": double}
+
+    def best_action(self, hard: int, ace: bool, up: int, shoe: tuple | int,
+                    can_double: bool = True) -> tuple[str, dict]:
+        """(best action name, EVs), action in "stand" / "hit" / "double" """
+        evs = self.action_evs(hard, ace, up, shoe)
+        choices = ("stand", "hit", "double") if can_double else ("stand", "hit")
+        return max(choices, key=evs.get), evs
+
+    def decide(self, logic, player, dealer) -> str:
+        """
+        Best action for `player` at a live BlackjackLogic table, as a
+        run_action_player / Round.step() action string.
+        """
+        counts = list(shoe_composition(logic.deck))
+        if dealer.hole_card is not None and dealer.hole_card not in dealer.cards:
+            counts[card_value(dealer.hole_card)] += 1 # unseen, still in play for the dealer
+        hand = player.hand
+        hand.sync(player.cards)
+        action, _ = self.best_action(hand.hard, hand.aces > 0, card_value(dealer.cards[0]),
+                                     tuple(counts), can_double=logic.can_double(player))
+        return "double down" if action == "double" else action
+
+    def cache_info(self) -> dict:
+        return {"nodes": len(self._memo), "stand_rows": len(self._rows), "dealer": self.dealer.cache_info()}
+
+    def cache_clear(self):
+        self._memo.clear()
+        self._rows.clear()
+        self.dealer.cache_clear()
@@ -0,0 +1,160 @@
+"""
+Incremental card counting and shoe composition.
+
+CountTracker is a Shoe observer: every draw updates the running counts of the
+selected systems and the remaining-rank histogram in O(1), so counts, true
+counts and the composition can be read at any decision point without
+scanning the shoe.
+
+Tags are per rank, in blackjack_shoe RANK_NAMES order:
+    '2' '3' '4' '5' '6' '7' '8' '9' '10' 'J' 'Q' 'K' 'A'
+
+Unbalanced systems (KO) start from the usual initial running count,
+-(tag sum per deck) * (decks - 1), so the key count is the same for any shoe
+size. Balanced systems start at 0.
+"""
+from blackjack_shoe import ACE_RANK, CARDS_PER_DECK, RANK_NAMES, card_rank
+from blackjack_strategy import RANK_TO_VALUE
+
+COUNT_SYSTEMS = {
+    "hi_lo":    (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1),
+    "ko":       (1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1, -1),
+    "omega_ii": (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0),
+}
+
+SUITS_PER_RANK = CARDS_PER_DECK // len(RANK_NAMES)
+
+
+def initial_count(tags: tuple, decks: int) -> int:
+    """initial running count, 0 for balanced systems"""
+    return -sum(tags) * SUITS_PER_RANK * (decks - 1)
+
+
+class CountTracker:
+    """
+    Running / true counts and rank histogram over one shoe.
+
+    Args:
+        decks: Shoe size in decks.
+        systems: Names from COUNT_SYSTEMS, or a {name: 13 rank tags} mapping.
+    """
+    def __init__(self, decks: int = 1, systems=("hi_lo", "ko", "omega_ii")):
+        if decks < 1:
+            raise ValueError(f"Expected at least 1 deck, got {decks}")
+        self.decks = decks
+
+        if isinstance(systems, dict):
+            items = list(systems.items())
+        else:
+            items = []
+            for name in systems:
+                if name not in COUNT_SYSTEMS:
+                    raise ValueError(f"Expected a count system in {tuple(COUNT_SYSTEMS)}, got {name!r}")
+                items.append((name, COUNT_SYSTEMS[name]))
+        for name, tags in items:
+            if len(tags) != len(RANK_NAMES):
+                raise ValueError(f"Expected {len(RANK_NAMES)} rank tags for {name!r}, got {len(tags)}")
+
+        self.systems = tuple(name for name, _ in items)
+        self.tags = tuple(tuple(tags) for _, tags in items)
+        self._index = {name: i for i, name in enumerate(self.systems)}
+        # card code -> tag, one table per system
+        self._code_tags = tuple(tuple(tags[card_rank(code)] for code in range(CARDS_PER_DECK))
+                                for _, tags in items)
+        self._initial = tuple(initial_count(tags, decks) for _, tags in items)
+        self.running = list(self._initial)
+        self.ranks = [SUITS_PER_RANK * decks] * len(RANK_NAMES) # remaining per rank
+        self.seen = 0
+        self.shoe = None
+
+    # ---- Shoe observer ----------------------------------------------------
+    def on_draw(self, code: int):
+        """one card left the shoe, O(1)"""
+        running = self.running
+        for i, tags in enumerate(self._code_tags):
+            running[i] += tags[code]
+        self.ranks[code >> 2] -= 1
+        self.seen += 1
+
+    def on_return(self, code: int):
+        """a dealt card went back into the shoe (Shoe.put_back), O(1)"""
+        running = self.running
+        for i, tags in enumerate(self._code_tags):
+            running[i] -= tags[code]
+        self.ranks[code >> 2] += 1
+        self.seen -= 1
+
+    def on_reset(self):
+        """every card is back in the shoe"""
+        self.running[:] = self._initial
+        self.ranks[:] = [SUITS_PER_RANK * self.decks] * len(RANK_NAMES)
+        self.seen = 0
+
+    def attach(self, shoe):
+        """observe `shoe`, catching up on cards it has already dealt"""
+        if shoe.decks != self.decks:
+            raise ValueError(f"Expected a {self.decks} deck shoe, got {shoe.decks}")
+        if self.shoe is not None:
+            self.shoe.remove_observer(self)
+        self.on_reset()
+        for code in shoe.cards[:shoe.cursor]:
+            self.on_draw(code)
+        shoe.add_observer(self)
+        self.shoe = shoe
+
+    def snapshot(self) -> tuple:
+        """fixed-size state for restore(), alongside Shoe.snapshot()"""
+        return (tuple(self.running), tuple(self.ranks), self.seen)
+
+    def restore(self, snapshot: tuple):
+        running, ranks, seen = snapshot
+        self.running[:] = running
+        self.ranks[:] = ranks
+        self.seen = seen
+
+    def resized(self, decks: int) -> "CountTracker":
+        """fresh tracker with the same systems for another shoe size"""
+        return CountTracker(decks, dict(zip(self.systems, self.tags)))
+
+    def detach(self):
+        if self.shoe is not None:
+            self.shoe.remove_observer(self)
+            self.shoe = None
+
+    # ---- reads ------------------------------------------------------------
+    @property
+    def remaining(self) -> int:
+        return self.decks * CARDS_PER_DECK - self.seen
+
+    @property
+    def decks_remaining(self) -> float:
+        return self.remaining / CARDS_PER_DECK
+
+    def running_count(self, system: str = "hi_lo") -> int:
+        return self.running[self._index[system]]
+
+    def true_count(self, system: str = "hi_lo") -> float:
+        """running count per deck left (never divides by less than one card)"""
+        return self.running[self._index[system]] * CARDS_PER_DECK / max(self.remaining, 1)
+
+    def counts(self) -> dict:
+        """{system: (running, true)} for every tracked system"""
+        return {name: (self.running_count(name), self.true_count(name)) for name in self.systems}
+
+    def histogram(self) -> dict:
+        """remaining cards per rank name"""
+        return dict(zip(RANK_NAMES, self.ranks))
+
+    def composition(self) -> tuple:
+        """remaining cards by value index (0 = ace ... 9 = ten), the blackjack_strategy shoe format"""
+        counts = [0] * 10
+        for rank, count in enumerate(self.ranks):
+            counts[RANK_TO_VALUE[rank]] += count
+        return tuple(counts)
+
+    def aces_remaining(self) -> int:
+        return self.ranks[ACE_RANK]
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{name}={self.running_count(name)}" for name in self.systems)
+        return f"CountTracker(decks={self.decks}, remaining={self.remaining}, {counts})"
@@ -0,0 +1,124 @@
+"""
+Dealer final-total distributions.
+
+P(dealer ends on 17, 18, 19, 20, 21 or busts | upcard, remaining shoe), same
+play as the `while dealer["score"] < 17` loop in run_blackjack_console and
+GameBlackjack.the_check. The hole card is still in the shoe (no peek).
+
+Shoes are packed into one int, 8 bits per value count (value index 0 = ace,
+1..8 = 2..9, 9 = ten), so removing a card is a subtraction and the whole
+composition is a cheap, hashable cache key. Results sit in a bounded LRU.
+Soft 17 follows the engine's blackjack_rules.Rules (stands by default).
+"""
+from collections import OrderedDict
+
+from blackjack_rules import DEALER_STANDS_ON, Rules, compile_rules
+
+DEALER_TOTALS = (17, 18, 19, 20, 21) # outcome order, then bust
+
+COUNT_BITS = 8 # fits blackjack_rules.MAX_DECKS decks of ten-valued cards
+COUNT_MASK = (1 << COUNT_BITS) - 1
+VALUES = 10
+
+# final outcome vectors: a busted hand, and a hand standing on each total
+BUSTED_OUTCOMES = (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+STANDING_OUTCOMES = {total: tuple(1.0 if i == total - DEALER_STANDS_ON else 0.0 for i in range(6))
+                     for total in DEALER_TOTALS}
+
+
+def pack_shoe(shoe: tuple) -> int:
+    """10 value counts -> one int key"""
+    packed = 0
+    for value, count in enumerate(shoe):
+        if not 0 <= count <= COUNT_MASK:
+            raise ValueError(f"Count {count} for value {value} doesn't fit in {COUNT_BITS} bits")
+        packed |= count << (COUNT_BITS * value)
+    return packed
+
+
+def unpack_shoe(packed: int) -> tuple:
+    """one int key -> 10 value counts"""
+    return tuple((packed >> (COUNT_BITS * value)) & COUNT_MASK for value in range(VALUES))
+
+
+def hand_total(hard: int, ace: bool) -> int:
+    """same rule as check_hand, one ace goes to 11 if it fits"""
+    return hard + 10 if ace and hard + 10 <= 21 else hard
+
+
+class DealerOutcomes:
+    """
+    Memoized dealer-outcome engine with a bounded LRU cache.
+
+    Every node of the dealer's draw tree is cached on (hand, packed shoe), so
+    queries from related shoes (one card apart, as in EV recursion or a live
+    round) mostly hit the cache.
+    """
+    def __init__(self, cache_size: int = 1_000_000, rules: Rules | None = None):
+        self.rules = rules if rules is not None else Rules()
+        self._draws = compile_rules(self.rules).dealer_hits # soft 17 per rules
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def outcomes(self, up: int, shoe: tuple | int) -> tuple:
+        """
+        Args:
+            up: Dealer upcard value index (0 = ace ... 9 = ten).
+            shoe: Remaining shoe (hole card included), as counts or pack_shoe() key.
+
+        Returns:
+            (p17, p18, p19, p20, p21, p_bust)
+        """
+        packed = shoe if isinstance(shoe, int) else pack_shoe(shoe)
+        left = sum(unpack_shoe(packed))
+        return self._dealer(up + 1, up == 0, packed, left)
+
+    def _dealer(self, hard: int, ace: bool, packed: int, left: int) -> tuple:
+        if hard > 21:
+            return BUSTED_OUTCOMES
+        if not self._draws[(hard << 1) | ace]:
+            return STANDING_OUTCOMES[hard + 10 if ace and hard + 10 <= 21 else hard]
+        if not left:
+            raise ValueError("dealer has to draw from an empty shoe")
+
+        # hand fits in the low bits, shoe above it
+        key = (packed << 6) | (hard << 1) | ace
+        cache = self._cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        p17 = p18 = p19 = p20 = p21 = bust = 0.0
+        for value in range(VALUES):
+            count = (packed >> (COUNT_BITS * value)) & COUNT_MASK
+            if not count:
+                continue
+            weight = count / left
+            sub = self._dealer(hard + value + 1, ace or value == 0,
+                               packed - (1 << (COUNT_BITS * value)), left - 1)
+            p17 += weight * sub[0]
+            p18 += weight * sub[1]
+            p19 += weight * sub[2]
+            p20 += weight * sub[3]
+            p21 += weight * sub[4]
+            bust += weight * sub[5]
+
+        result = (p17, p18, p19, p20, p21, bust)
+        cache[key] = result
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._cache), "max_size": self.cache_size}
+
+    def cache_clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
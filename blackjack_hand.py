@@ -0,0 +1,179 @@
+"""
+Incremental hand scoring.
+
+Hand keeps its hard total (aces counted as 1) and ace count up to date as cards
+are added, so the score is O(1) per card instead of re-parsing every card
+string. Same rule as BlackjackLogic.check_hand: aces count 1, one ace is
+promoted to 11 if that doesn't bust the hand.
+
+score_hands() applies the same rule to a whole 2-D array of rank indices at
+once (NumPy, imported on first use), for scoring logged hands in bulk.
+"""
+from blackjack_shoe import RANK_NAMES, CARD_NAMES, ACE_RANK, card_rank
+
+# rank index -> hard value (ace = 1)
+RANK_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
+PAD_RANK = -1 # empty slot in score_hands() rows, scores 0 like an unknown card
+
+# client name ("QH") -> rank index, fast path
+_RANK_OF_NAME = {name: card_rank(code) for code, name in enumerate(CARD_NAMES)}
+# rank prefix ("Q") -> rank index, for any other "<rank><one char>" string
+_RANK_OF_PREFIX = {rank: index for index, rank in enumerate(RANK_NAMES)}
+
+
+# client name / card code -> hard value, one dict hit per card on the hot path
+_VALUE_OF = {name: RANK_VALUES[rank] for name, rank in _RANK_OF_NAME.items()}
+_VALUE_OF.update({code: RANK_VALUES[card_rank(code)] for code in range(len(CARD_NAMES))})
+
+
+def rank_of(card: str | int) -> int | None:
+    """rank index of a card code or name, None if unknown (scores 0)"""
+    if isinstance(card, int):
+        return card_rank(card)
+    rank = _RANK_OF_NAME.get(card)
+    if rank is None:
+        rank = _RANK_OF_PREFIX.get(card[:-1]) # same slice as check_hand
+    return rank
+
+
+def card_points(card: str | int) -> int:
+    """hard value of one card (ace = 1), 0 if unknown like check_hand"""
+    value = _VALUE_OF.get(card)
+    if value is None:
+        rank = rank_of(card)
+        value = 0 if rank is None else RANK_VALUES[rank]
+    return value
+
+
+def score_cards(cards) -> tuple[int, bool]:
+    """(total, busted) for a whole card list, no Hand object"""
+    hard = 0
+    ace = False
+    values = _VALUE_OF
+    for card in cards:
+        value = values.get(card)
+        if value is None:
+            value = card_points(card)
+        hard += value
+        if value == 1:
+            ace = True
+    total = hard + 10 if ace and hard <= 11 else hard
+    return total, hard > 21
+
+
+_value_table = None # RANK_VALUES + padding as an ndarray, built on first score_hands()
+
+
+def hand_ranks(hands, width: int | None = None):
+    """
+    Padded int8 rank array for score_hands() from card lists (names or codes).
+    Unknown cards become PAD_RANK, they score 0 in check_hand too.
+    """
+    import numpy as np
+
+    hands = list(hands)
+    if width is None:
+        width = max((len(cards) for cards in hands), default=0)
+    ranks = np.full((len(hands), width), PAD_RANK, dtype=np.int8)
+    for row, cards in enumerate(hands):
+        if len(cards) > width:
+            raise ValueError(f"Expected at most {width} cards per hand, got {len(cards)}")
+        for col, card in enumerate(cards):
+            rank = rank_of(card)
+            if rank is not None:
+                ranks[row, col] = rank
+    return ranks
+
+
+def score_hands(ranks):
+    """
+    check_hand for many hands in one pass.
+
+    Args:
+        ranks: 2-D array, one hand per row, rank indices (0 = '2' ... 12 = ace)
+               padded with PAD_RANK (see hand_ranks()).
+
+    Returns:
+        (totals, soft, busted) arrays, one entry per row. totals and busted
+        match score_cards / check_hand exactly, soft is True where an ace
+        counts as 11.
+    """
+    import numpy as np
+
+    global _value_table
+    if _value_table is None:
+        _value_table = np.array(RANK_VALUES + (0,), dtype=np.int16) # index -1 = padding
+
+    ranks = np.asarray(ranks)
+    if ranks.ndim != 2:
+        raise ValueError(f"Expected a 2-D rank array, got shape {ranks.shape}")
+    if ranks.size and (ranks.min() < PAD_RANK or ranks.max() > ACE_RANK):
+        raise ValueError(f"Expected ranks in [{PAD_RANK}, {ACE_RANK}], got [{ranks.min()}, {ranks.max()}]")
+
+    hard = _value_table[ranks].sum(axis=1, dtype=np.int32)
+    soft = (ranks == ACE_RANK).any(axis=1) & (hard <= 11)
+    totals = hard + 10 * soft
+    return totals, soft, hard > 21
+
+
+class Hand:
+    """running hard total / ace count for one hand"""
+    __slots__ = ("hard", "aces", "count", "_source")
+
+    def __init__(self, cards=()):
+        self.hard = 0
+        self.aces = 0
+        self.count = 0
+        self._source = None # list last synced with sync()
+        for card in cards:
+            self.add(card)
+
+    def reset(self):
+        self.hard = 0
+        self.aces = 0
+        self.count = 0
+        self._source = None
+
+    def add(self, card: str | int):
+        """add one card, O(1)"""
+        value = _VALUE_OF.get(card)
+        if value is None:
+            value = card_points(card)
+        self.count += 1
+        self.hard += value
+        if value == 1:
+            self.aces += 1
+
+    def add_rank(self, rank: int):
+        """add one card by rank index, skips name lookup"""
+        self.count += 1
+        self.hard += RANK_VALUES[rank]
+        if rank == ACE_RANK:
+            self.aces += 1
+
+    def sync(self, cards: list):
+        """
+        catch up with a seat's card list, only new cards are scored.
+        A different (or shorter) list means the seat was reset, so start over.
+        """
+        if cards is not self._source or len(cards) < self.count:
+            self.reset()
+            self._source = cards
+        for i in range(self.count, len(cards)):
+            self.add(cards[i])
+
+    @property
+    def soft(self) -> bool:
+        """an ace is currently counted as 11"""
+        return self.aces > 0 and self.hard + 10 <= 21
+
+    @property
+    def total(self) -> int:
+        return self.hard + 10 if self.soft else self.hard
+
+    @property
+    def busted(self) -> bool:
+        return self.hard > 21
+
+    def __repr__(self) -> str:
+        return f"Hand(total={self.total}, soft={self.soft}, cards={self.count})"
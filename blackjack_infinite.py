@@ -0,0 +1,215 @@
+"""
+Infinite-deck analytic mode.
+
+With an infinite shoe every draw is the same fixed distribution (1/13 per
+rank, 4/13 for ten-valued), so nothing depends on composition: the dealer's
+odds are one small recursion over (hard, ace) per rule set, and every player
+EV is a function of (hard, ace, upcard) alone. A whole action-EV table for a
+Rules (e.g. `logic.rules`) takes milliseconds, against seconds for the exact
+finite-shoe StrategySolver, at the price of the composition effects that
+matter most for 1-2 decks.
+
+error_report() measures that price: it compares the infinite-deck tables to
+finite-shoe ones (1 and 8 decks by default) with pluggable metrics and a
+pluggable reference table source.
+"""
+from blackjack_dealer import BUSTED_OUTCOMES, DEALER_TOTALS, STANDING_OUTCOMES, hand_total
+from blackjack_rules import Rules, compile_rules
+from blackjack_strategy import VALUE_NAMES, StrategySolver, shoe_counts, remove_cards
+
+# value index 0 = ace, 1..8 = 2..9, 9 = ten-valued
+DRAW_PROBS = (1 / 13,) * 9 + (4 / 13,)
+
+
+class InfiniteSolver:
+    """
+    EV of stand / hit / double with a fixed draw distribution.
+
+    Same results format as StrategySolver (action_evs, row_evs,
+    strategy_table), same rules handling: soft 17, double restrictions and
+    the natural payout come from `rules`. Shoe size is ignored.
+    """
+    def __init__(self, rules: Rules | None = None):
+        self.rules = rules if rules is not None else Rules()
+        tables = compile_rules(self.rules)
+        self._dealer_hits = tables.dealer_hits
+        self._double_ok = tables.double_ok
+        self._dealer_memo = {}
+        self._best_memo = {}
+
+    # ---- dealer -----------------------------------------------------------
+    def _dealer(self, hard: int, ace: bool) -> tuple:
+        if hard > 21:
+            return BUSTED_OUTCOMES
+        if not self._dealer_hits[(hard << 1) | ace]:
+            return STANDING_OUTCOMES[hand_total(hard, ace)]
+        key = (hard << 1) | ace
+        cached = self._dealer_memo.get(key)
+        if cached is not None:
+            return cached
+        result = [0.0] * 6
+        for value, weight in enumerate(DRAW_PROBS):
+            sub = self._dealer(hard + value + 1, ace or value == 0)
+            for i in range(6):
+                result[i] += weight * sub[i]
+        result = self._dealer_memo[key] = tuple(result)
+        return result
+
+    def dealer_outcomes(self, up: int) -> tuple:
+        """P(dealer ends on 17, 18, 19, 20, 21, bust) for upcard value index `up`"""
+        return self._dealer(up + 1, up == 0)
+
+    # ---- player -----------------------------------------------------------
+    def stand_ev(self, hard: int, ace: bool, up: int) -> float:
+        if hard > 21:
+            return -1.0
+        total = hand_total(hard, ace)
+        probs = self.dealer_outcomes(up)
+        ev = probs[5]
+        for i, dealer_total in enumerate(DEALER_TOTALS):
+            if total > dealer_total:
+                ev += probs[i]
+            elif total < dealer_total:
+                ev -= probs[i]
+        return ev
+
+    def _draw_one(self, hard, ace, up, then) -> float:
+        ev = 0.0
+        for value, weight in enumerate(DRAW_PROBS):
+            new_hard = hard + value + 1
+            ev += weight * (-1.0 if new_hard > 21 else then(new_hard, ace or value == 0, up))
+        return ev
+
+    def hit_ev(self, hard: int, ace: bool, up: int) -> float:
+        return self._draw_one(hard, ace, up, self._best_ev)
+
+    def double_ev(self, hard: int, ace: bool, up: int) -> float:
+        return 2.0 * self._draw_one(hard, ace, up, self.stand_ev)
+
+    def _best_ev(self, hard: int, ace: bool, up: int) -> float:
+        """value of a hand after at least one hit"""
+        key = (hard, ace, up)
+        cached = self._best_memo.get(key)
+        if cached is not None:
+            return cached
+        best = self.stand_ev(hard, ace, up)
+        total = hand_total(hard, ace)
+        if total < 21:
+            best = max(best, self.hit_ev(hard, ace, up))
+            if self._double_ok[False][total]:
+                best = max(best, self.double_ev(hard, ace, up))
+        self._best_memo[key] = best
+        return best
+
+    def action_evs(self, hard: int, ace: bool, up: int) -> dict:
+        """EV of every action for one hand, allowed or not"""
+        return {
+            "stand": self.stand_ev(hard, ace, up),
+            "hit": self.hit_ev(hard, ace, up),
+            "double": self.double_ev(hard, ace, up),
+        }
+
+    # ---- tables -----------------------------------------------------------
+    def row_evs(self, total: int, soft: bool, up: int) -> dict:
+        """action EVs for a two-card (total, soft) row, same conventions as StrategySolver.row_evs"""
+        evs = self.action_evs(total - 10 if soft else total, soft, up)
+        if total == 21 and soft: # every two-card soft 21 is a natural
+            evs["stand"] *= self.rules.blackjack_pays
+        if not self._double_ok[True][total]:
+            del evs["double"]
+        return evs
+
+    def strategy_table(self) -> dict:
+        """{(total, soft, upcard): {"evs": {action: ev}, "best": action}}, StrategySolver rows"""
+        rows = [(total, False) for total in range(4, 21)]
+        rows += [(total, True) for total in range(12, 22)]
+        table = {}
+        for total, soft in rows:
+            for up in range(10):
+                evs = self.row_evs(total, soft, up)
+                table[(total, soft, up)] = {"evs": evs, "best": max(evs, key=evs.get)}
+        return table
+
+
+def infinite_table(rules: Rules | None = None) -> dict:
+    """InfiniteSolver(rules).strategy_table(), e.g. for `logic.rules`"""
+    return InfiniteSolver(rules).strategy_table()
+
+
+# ---- error reporting ----------------------------------------------------------
+def max_abs_ev(approx: dict, exact: dict) -> float:
+    return max((abs(approx[key]["evs"][action] - row["evs"][action])
+                for key, row in exact.items() for action in row["evs"]), default=0.0)
+
+
+def mean_abs_ev(approx: dict, exact: dict) -> float:
+    errors = [abs(approx[key]["evs"][action] - row["evs"][action])
+              for key, row in exact.items() for action in row["evs"]]
+    return sum(errors) / len(errors) if errors else 0.0
+
+
+def best_action_mismatches(approx: dict, exact: dict) -> list:
+    """rows where the infinite deck picks another action, (total, soft, up, exact, approx)"""
+    return [(*key, row["best"], approx[key]["best"]) for key, row in sorted(exact.items())
+            if approx[key]["best"] != row["best"]]
+
+
+def dealer_max_abs(rules: Rules) -> float:
+    """largest per-upcard dealer outcome error against a full finite shoe"""
+    exact = StrategySolver(rules=rules)
+    approx = InfiniteSolver(rules)
+    full = shoe_counts(rules.decks)
+    return max(abs(a - b) for up in range(10)
+               for a, b in zip(approx.dealer_outcomes(up), exact.dealer_outcomes(up, remove_cards(full, (up,)))))
+
+
+DEFAULT_METRICS = {
+    "max_abs_ev": max_abs_ev,
+    "mean_abs_ev": mean_abs_ev,
+    "best_action_mismatches": best_action_mismatches,
+}
+
+
+def error_report(rules: Rules | None = None, decks=(1, 8), metrics: dict | None = None,
+                 reference=None) -> dict:
+    """
+    Infinite-deck strategy table against finite shoes.
+
+    Args:
+        rules: Rules to compare under, their deck count is replaced by each of `decks`.
+        metrics: name -> metric(approx_table, exact_table), DEFAULT_METRICS by default.
+        reference: rules -> exact strategy table, default StrategySolver(rules=rules).strategy_table
+                   (pass blackjack_tables.strategy_table to reuse the disk cache).
+
+    Returns:
+        {decks: {metric name: value, ..., "dealer_max_abs": float}}
+    """
+    rules = rules if rules is not None else Rules()
+    metrics = metrics if metrics is not None else DEFAULT_METRICS
+    if reference is None:
+        reference = lambda finite: StrategySolver(rules=finite).strategy_table()
+
+    approx = infinite_table(rules)
+    report = {}
+    for count in decks:
+        finite = rules._replace(decks=count)
+        exact = reference(finite)
+        report[count] = {name: metric(approx, exact) for name, metric in metrics.items()}
+        report[count]["dealer_max_abs"] = dealer_max_abs(finite)
+    return report
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    infinite_table()
+    t1 = time.perf_counter()
+    print(f"infinite-deck table in {(t1 - t0) * 1e3:.1f} ms\n")
+    for count, errors in error_report().items():
+        print(f"{count} deck(s): max |EV error| {errors['max_abs_ev']:.4f}, "
+              f"mean {errors['mean_abs_ev']:.4f}, dealer odds {errors['dealer_max_abs']:.4f}, "
+              f"{len(errors['best_action_mismatches'])} rows play differently")
+        for total, soft, up, exact, approx in errors["best_action_mismatches"]:
+            print(f"    {'soft' if soft else 'hard'} {total:>2} vs {VALUE_NAMES[up]:>2}: "
+                  f"{exact} (finite) / {approx} (infinite)")
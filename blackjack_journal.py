@@ -0,0 +1,288 @@
+"""
+Append-only binary round journal.
+
+Every round played through BlackjackLogic (with a RoundRecorder attached as
+`table.journal`) becomes one length-prefixed, varint-encoded record:
+
+    varint  payload length
+    varint  round id
+    varint  natural payout, hundredths of the bet (100 = 1:1, 150 = 3:2)
+    varint  seat count, then one varint bet (cents) per seat
+    varint  event count, then events:
+                1 byte op (high nibble) | seat (low nibble, 15 = dealer)
+                + 1 byte card code for OP_DEAL
+    per seat: 1 byte outcome + zigzag varint net (cents)
+
+Deals are stored in draw order (hole card included), so a round can be
+re-executed from the journal alone, no RNG involved. replay() does that with
+plain integer scoring; rebuild_shoe() hands the recorded cards back as a Shoe
+to re-run a disputed round through BlackjackLogic itself.
+"""
+from blackjack_hand import RANK_VALUES
+from blackjack_shoe import ACE_RANK, CARD_CODES, Shoe
+
+MAGIC = b"BJJ2" # BJJ2: natural payout per record
+
+# event ops, high nibble
+OP_DEAL = 0x00
+OP_HIT = 0x10
+OP_STAND = 0x20
+OP_DOUBLE = 0x30
+DEALER_SEAT = 0x0F
+
+ACTION_OPS = {"hit": OP_HIT, "stand": OP_STAND, "double_down": OP_DOUBLE}
+
+# per seat outcomes
+WIN, LOSE, PUSH, BUST = range(4)
+OUTCOME_NAMES = ("win", "lose", "push", "bust")
+
+# card code -> hard value / is ace, for replay scoring
+_CODE_VALUE = bytes(RANK_VALUES[code >> 2] for code in range(52))
+_CODE_ACE = bytes(int(code >> 2 == ACE_RANK) for code in range(52))
+
+
+def write_varint(out: bytearray, n: int):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(buf, pos: int) -> tuple[int, int]:
+    """returns (value, next position)"""
+    n = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def zigzag(n: int) -> int:
+    return n << 1 if n >= 0 else (-n << 1) - 1
+
+
+def unzigzag(n: int) -> int:
+    return n >> 1 if not n & 1 else -((n + 1) >> 1)
+
+
+def to_cents(amount: float) -> int:
+    return int(round(amount * 100))
+
+
+class JournalWriter:
+    """buffered append-only writer, writes the magic header on a new file"""
+    def __init__(self, path, buffer_size: int = 1 << 16):
+        self.path = path
+        self._file = open(path, "ab", buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+
+    def write(self, payload: bytes):
+        prefix = bytearray()
+        write_varint(prefix, len(payload))
+        self._file.write(prefix)
+        self._file.write(payload)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RoundRecorder:
+    """
+    BlackjackLogic hook, collects one round at a time.
+
+    Seats are matched by identity against the seats passed to begin_round();
+    calls for unknown seats (or outside a round) are ignored, so the Ursina
+    flow can share a table with a recorder attached.
+    """
+    def __init__(self, writer: JournalWriter | None = None):
+        self.writer = writer
+        self.round_id = 0
+        self.records = [] # finished payloads when there's no writer
+        self._seats = None
+        self._bets = []
+        self._natural_pays = 100
+        self._events = bytearray()
+        self._results = []
+
+    def begin_round(self, players: list, dealer, natural_pays: float = 1.0):
+        """start a round, `natural_pays` is the table's rules.blackjack_pays"""
+        self._seats = {id(player): index for index, player in enumerate(players)}
+        self._seats[id(dealer)] = DEALER_SEAT
+        self._bets = [to_cents(player.bet or 0) for player in players]
+        self._natural_pays = to_cents(natural_pays)
+        self._events = bytearray()
+        self._results = [(PUSH, 0)] * len(players)
+
+    def deal(self, seat, card: str):
+        index = self._seats.get(id(seat)) if self._seats else None
+        if index is not None:
+            self._events.append(OP_DEAL | index)
+            self._events.append(CARD_CODES[card])
+
+    def action(self, seat, action: str):
+        index = self._seats.get(id(seat)) if self._seats else None
+        if index is not None and index != DEALER_SEAT:
+            self._events.append(ACTION_OPS[action] | index)
+
+    def result(self, seat, outcome: int, amount: float):
+        index = self._seats.get(id(seat)) if self._seats else None
+        if index is not None and index != DEALER_SEAT:
+            net = to_cents(amount)
+            self._results[index] = (outcome, net if outcome == WIN else -net if outcome != PUSH else 0)
+
+    def end_round(self) -> bytes | None:
+        if self._seats is None:
+            return None
+        payload = bytearray()
+        write_varint(payload, self.round_id)
+        write_varint(payload, self._natural_pays)
+        write_varint(payload, len(self._bets))
+        for bet in self._bets:
+            write_varint(payload, bet)
+        write_varint(payload, len(self._events))
+        payload += self._events
+        for outcome, net in self._results:
+            payload.append(outcome)
+            write_varint(payload, zigzag(net))
+
+        payload = bytes(payload)
+        if self.writer is not None:
+            self.writer.write(payload)
+        else:
+            self.records.append(payload)
+        self.round_id += 1
+        self._seats = None
+        return payload
+
+
+def iter_payloads(path):
+    """raw record payloads from a journal file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Expected a {MAGIC.decode()} round journal, got header {data[:len(MAGIC)]!r} in {path}")
+    pos = len(MAGIC)
+    while pos < len(data):
+        size, pos = read_varint(data, pos)
+        yield data[pos:pos + size]
+        pos += size
+
+
+def decode_round(payload: bytes) -> dict:
+    """one payload -> readable dict, for audits"""
+    round_id, pos = read_varint(payload, 0)
+    natural_pays, pos = read_varint(payload, pos)
+    seats, pos = read_varint(payload, pos)
+    bets = []
+    for _ in range(seats):
+        bet, pos = read_varint(payload, pos)
+        bets.append(bet / 100)
+    size, pos = read_varint(payload, pos)
+    end = pos + size
+    events = []
+    while pos < end:
+        op, seat = payload[pos] & 0xF0, payload[pos] & 0x0F
+        pos += 1
+        if op == OP_DEAL:
+            events.append(("deal", seat, payload[pos]))
+            pos += 1
+        else:
+            events.append(({OP_HIT: "hit", OP_STAND: "stand", OP_DOUBLE: "double_down"}[op], seat, None))
+    results = []
+    for _ in range(seats):
+        outcome = payload[pos]
+        net, pos = read_varint(payload, pos + 1)
+        results.append((OUTCOME_NAMES[outcome], unzigzag(net) / 100))
+    return {"round": round_id, "natural_pays": natural_pays / 100, "bets": bets, "events": events, "results": results}
+
+
+def rebuild_shoe(payload: bytes) -> Shoe:
+    """the round's cards in draw order as an unshuffled Shoe, to re-run it through BlackjackLogic"""
+    return Shoe.from_codes([card for op, _, card in decode_round(payload)["events"] if op == "deal"])
+
+
+def replay_round(payload: bytes, _value=_CODE_VALUE, _ace=_CODE_ACE) -> bool:
+    """
+    re-execute one round from its record, True if the recorded results match;
+    a natural's win may differ by a cent, the table rounded bet * payout itself
+    """
+    _, pos = read_varint(payload, 0) # round id
+    natural_pays, pos = read_varint(payload, pos)
+    seats, pos = read_varint(payload, pos)
+    stake = [0] * seats
+    for i in range(seats):
+        stake[i], pos = read_varint(payload, pos)
+    size, pos = read_varint(payload, pos)
+    end = pos + size
+
+    hard = [0] * 16 # indexed by seat nibble, dealer is 15
+    aces = [0] * 16
+    cards = [0] * 16
+    while pos < end:
+        op = payload[pos]
+        if op < OP_HIT:
+            card = payload[pos + 1]
+            hard[op] += _value[card]
+            aces[op] += _ace[card]
+            cards[op] += 1
+            pos += 2
+        else:
+            if op >= OP_DOUBLE:
+                stake[op & 0x0F] *= 2
+            pos += 1
+
+    d_hard = hard[DEALER_SEAT]
+    d_total = d_hard + 10 if aces[DEALER_SEAT] and d_hard <= 11 else d_hard
+    for seat in range(seats):
+        p_hard = hard[seat]
+        p_total = p_hard + 10 if aces[seat] and p_hard <= 11 else p_hard
+        slack = 0
+        if p_hard > 21:
+            expected, net = BUST, -stake[seat]
+        elif d_hard > 21 or p_total > d_total:
+            expected, net = WIN, stake[seat]
+            if cards[seat] == 2 and p_total == 21 and natural_pays != 100:
+                net, slack = stake[seat] * natural_pays // 100, 1
+        elif p_total < d_total:
+            expected, net = LOSE, -stake[seat]
+        else:
+            expected, net = PUSH, 0
+
+        if payload[pos] != expected:
+            return False
+        recorded, pos = read_varint(payload, pos + 1)
+        if not 0 <= unzigzag(recorded) - net <= slack:
+            return False
+    return True
+
+
+def replay(source) -> dict:
+    """
+    Replay a journal file (or an iterable of payloads).
+
+    Returns:
+        {"rounds": n, "mismatches": [round ids whose recorded results differ]}
+    """
+    payloads = iter_payloads(source) if isinstance(source, str) or hasattr(source, "__fspath__") else source
+    rounds = 0
+    mismatches = []
+    check = replay_round
+    for payload in payloads:
+        if not check(payload):
+            mismatches.append(read_varint(payload, 0)[0])
+        rounds += 1
+    return {"rounds": rounds, "mismatches": mismatches}
@@ -70,17 +70,22 @@ the dealer flips it over immediately → all players without blackjack lose inst
     - Tie -> Push (no one wins, bet returned)
 """
 
-import random
-import math
 from painting_on_water import vinput
+from blackjack_rng import get_rng
+from blackjack_shoe import Shoe
+from blackjack_hand import score_cards
+from blackjack_seats import Player, Dealer
+from blackjack_journal import RoundRecorder, WIN, LOSE, BUST
+from blackjack_round import Round, BETTING, PLAYER_TURN
+from blackjack_trace import Tracer, StdoutSink, DEFAULT_CATEGORIES
+from blackjack_count import CountTracker
+from blackjack_stats import StatsRecorder
+from blackjack_rules import Rules, RuleTables, compile_rules
 
 # [x] top-level TODO: test play flow
 # [x] top-level TODO: wrap input prompts with validations (generalized function)
 # [ ] top-level TODO: re-make with Game class to hold deck, players, dealers and state, easier than passing dicts
 
-# real randomness from the OS entropy pool
-sys_rand = random.SystemRandom()
-
 # useful lists
 NUMBER_CARDS = [str(i) for i in range(2, 11)]
 FACE_CARDS = ['J', 'Q', 'K']
@@ -91,49 +96,79 @@ RANKS = NUMBER_CARDS + FACE_CARDS + ACE
 # one full deck
 ORIGIN_DECK = [card + ' ' + suit + ' ' for card in RANKS for suit in SUITS]
 
-# debug stuff, verbosity
+# debug stuff, verbosity: default trace categories for new tables, see blackjack_trace
 DEBUG = True
 
 class BlackjackLogic:
-    def __init__(self):
+    def __init__(self, rng=None, journal: RoundRecorder | None = None, tracer: Tracer | None = None,
+                 counter: CountTracker | None = None, stats: StatsRecorder | None = None,
+                 rules: Rules | None = None):
         self.players = []
         self.dealer = []
         self.deck = []
+        # crypto (OS entropy) by default, pass make_rng("fast", seed) for reproducible runs
+        self.rng = rng if rng is not None else get_rng()
+        # optional round journal, see blackjack_journal
+        self.journal = journal
+        # debug events, buffered and printed on flush(); pass Tracer() for a silent table
+        if tracer is None:
+            tracer = Tracer(DEFAULT_CATEGORIES if DEBUG else (), sinks=[StdoutSink()])
+        self.tracer = tracer
+        # optional running counts / composition, follows self.deck, see blackjack_count
+        self.counter = counter
+        # optional streaming results per seat / bet unit, see blackjack_stats
+        self.stats = stats
+        # shoe size, soft 17, doubling and payouts, see blackjack_rules
+        self.rules = rules if rules is not None else Rules()
+
+    @property
+    def rules(self) -> Rules:
+        return self.compiled.rules
+
+    @rules.setter
+    def rules(self, rules: Rules):
+        # lookup tables built once per rule set, the round code only indexes them
+        self.compiled: RuleTables = compile_rules(rules)
+
+    def can_double(self, player) -> bool:
+        """money covers doubling and the rules allow it for this hand"""
+        return (player.money >= player.bet * 2
+                and self.compiled.double_ok[len(player.cards) == 2][min(player.score, 31)])
+
+    def dealer_hits(self, dealer) -> bool:
+        """the dealer's scored hand has to take another card"""
+        return self.compiled.dealer_draws(dealer.hand)
 
     def check_hand(self, hand: list[str]) -> dict:
         """return 'bust' or card score if not bust"""
+        # compatible wrapper, the value table lives in blackjack_hand
+        score, busted = score_cards(hand)
+        return {"score": score, "busted": busted}
 
-        # convert cards to score
-        score = 0
-        ace_count = 0
-        for card in hand:
-            card = card[:-1] # SPECIFIC TO ursina game
-            if card in FACE_CARDS:
-                score += 10
-            elif card in ACE:
-                ace_count += 1
-            elif card in NUMBER_CARDS:
-                score += int(card)
-
-        # determine aces score
-        score += ace_count # default to one
-        for _ in range(ace_count):
-            if score + 10 <= 21:
-                score += 10 # change to 11 if beneficial
-        
-        return {"score": score, "busted": score > 21}
+    def draw(self, deck: Shoe | list) -> str:
+        """take one card out of the deck, O(1) for both shoes and lists"""
+        if isinstance(deck, Shoe):
+            return deck.draw_name()
 
-    def hit(self, player: dict, deck: list, count: int = 1, debug=False):
+        # list decks (main.py ref_deck): swap random pick with last, then pop
+        index = self.rng.randrange(len(deck))
+        deck[index], deck[-1] = deck[-1], deck[index]
+        return deck.pop()
+
+    def hit(self, player: Player | Dealer, deck: Shoe | list, count: int = 1, debug=None):
         """change player hand in place, remove from deck in place"""
+        # debug: True / False force the trace event on / off, None follows self.tracer
+        trace = debug or (debug is None and self.tracer.deal)
         for _ in range(count):
-            random_card = sys_rand.choice(deck)
-            deck.remove(random_card)
-            player["cards"].append(random_card)
-            if debug:
-                print(f"You hit {random_card}")
+            random_card = self.draw(deck)
+            player.cards.append(random_card)
+            if self.journal is not None:
+                self.journal.deal(player, random_card)
+            if trace:
+                self.tracer.emit("deal", player.name, payload=random_card)
 
 
-    def initial_deal(self, players: list[dict], dealer: dict, deck: list):
+    def initial_deal(self, players: list[Player], dealer: Dealer, deck: Shoe | list):
         """order matters:
         - each player gets 1 face up card
         - dealer gets 1 card face up (the "upcard")
@@ -153,43 +188,27 @@ class BlackjackLogic:
             self.hit(player, deck)
 
         # fourth deal house face down
-        random_card = sys_rand.choice(deck)
-        deck.remove(random_card)
-        dealer["hole_card"] = random_card
+        dealer.hole_card = self.draw(deck)
+        if self.journal is not None:
+            self.journal.deal(dealer, dealer.hole_card)
 
 
-    def seat_player(self, name: str, budget: float):
+    def seat_player(self, name: str, budget: float) -> Player:
         """add player to list using decided struct"""
-        new_player = {
-            "name": name,
-            "money": budget,
-            "bet": None, # (float)
-            "cards": [],
-            "score": None, # (int) card from check_hand()
-            "stand": False, # indicates player turn is over
-            "busted": False # check_hand()
-        }
+        new_player = Player(name, budget)
         self.players.append(new_player)
+        return new_player
 
 
-    def seat_dealer(self, name: str):
+    def seat_dealer(self, name: str) -> Dealer:
         """organized way to get fresh dealer"""
-        dealer = {
-            "name": name,
-            "money": math.inf,
-            "bet": 0, # placeholder to avoid errors
-            "cards": [],
-            "score": 0, # (int) card from check_hand()
-            "hole_card": None,
-            "stand": False, # indicates dealer turn is over
-            "busted": False # check_hand()
-        }
+        dealer = Dealer(name)
 
         self.dealer = dealer
         return dealer
 
 
-    def run_action_player(self, action: str, player:dict, deck: list, debug=DEBUG):
+    def run_action_player(self, action: str, player: Player, deck: Shoe | list, debug=None):
         """specific player action logic, calls process_turn()"""
         # TODO: introduce AI mapping resolution
 
@@ -204,222 +223,329 @@ class BlackjackLogic:
         else:
             return "not_mapped"
 
+        allowed = action != "double_down" or self.can_double(player)
+        if self.journal is not None and action != "split" and allowed: # split isn't played, nothing to record
+            self.journal.action(player, action)
+
+        if (debug or (debug is None and self.tracer.action)) and action != "split" and allowed:
+            self.tracer.emit("action", player.name, payload=action)
+
         if action == "hit":
-            if debug: print("Hit!")
             self.hit(player, deck, 1)
 
         elif action == "stand":
-            if debug: print("Stand!")
-            player["stand"] = True
+            player.stand = True
 
-        elif action == "double_down" and player["money"] >= player["bet"] * 2:
-            if debug: print("Double Down!")
+        elif action == "double_down" and allowed:
             self.hit(player, deck, 1)
-            player["bet"] = player["bet"] * 2
-            player["stand"] = True
+            player.bet = player.bet * 2
+            player.stand = True
         
         self.process_turn(player)
         return
         # not implemented
         if action == "split":
-            if debug: print("Split!")
-            if len(player["cards"]) == 2 and player["cards"][0] == player["cards"][1]:
+            if len(player.cards) == 2 and player.cards[0] == player.cards[1]:
                 print("POSSIBLE (NOT YET IMPLEMENTED)")
 
 
-    def player_bust(self, player, debug=DEBUG):
+    def player_bust(self, player, debug=None):
         """boilerplate bust code"""
-        if debug:
-            print(f"Player {player["name"]} busted with score {player["score"]},",
-                f"losing {player["bet"]}$")
-            print(player["cards"])
-        player["busted"] = True
-        player["stand"] = True
-        player["money"] -= player["bet"]
-        player["bet"] = 0
-        # player["score"] = 0
-        # player["cards"] = [] # TODO: fix temp fix
-
-
-    def player_win(self, player, debug=DEBUG):
-        """boilerplate win code"""
-        if debug:
-            print(f"Player {player["name"]} won with score {player["score"]},",
-                f"winning {player["bet"]}$")
-            print(player["cards"])
-        player["busted"] = False
-        player["stand"] = False
-        player["money"] += player["bet"]
-        player["bet"] = 0
-        player["score"] = 0
-        player["cards"] = []
-
-
-    def player_lose(self, player, debug=DEBUG):
+        if debug or (debug is None and self.tracer.bust):
+            self.tracer.emit("bust", player.name, player.score, player.bet, tuple(player.cards))
+        if not isinstance(player, Dealer): # a dealer bust settles through the players
+            if self.journal is not None:
+                self.journal.result(player, BUST, player.bet)
+            if self.stats is not None:
+                self.stats.result(player, BUST, player.bet)
+        player.busted = True
+        player.stand = True
+        player.money -= player.bet
+        player.bet = 0
+        # player.score = 0
+        # player.cards = [] # TODO: fix temp fix
+
+
+    def player_win(self, player, debug=None):
+        """boilerplate win code, a natural pays rules.blackjack_pays"""
+        natural = len(player.cards) == 2 and player.score == 21
+        amount = player.bet * self.compiled.win_payout[natural]
+        if debug or (debug is None and self.tracer.win):
+            self.tracer.emit("win", player.name, player.score, amount, tuple(player.cards))
+        if self.journal is not None:
+            self.journal.result(player, WIN, amount)
+        if self.stats is not None:
+            self.stats.result(player, WIN, amount)
+        player.money += amount
+        player.bet = 0
+        player.reset(score=0)
+
+
+    def player_lose(self, player, debug=None):
         """boilerplate lose code"""
-        if debug:
-            print(f"Player {player["name"]} lost with score {player["score"]}, ",
-                f"losing {player["bet"]}$")
-        player["busted"] = False
-        player["stand"] = False
-        player["money"] -= player["bet"]
-        player["bet"] = 0
-        player["score"] = 0
-        player["cards"] = []
-
-
-    def player_reset(self, player, debug=DEBUG):
+        if debug or (debug is None and self.tracer.lose):
+            self.tracer.emit("lose", player.name, player.score, player.bet)
+        if self.journal is not None:
+            self.journal.result(player, LOSE, player.bet)
+        if self.stats is not None:
+            self.stats.result(player, LOSE, player.bet)
+        player.money -= player.bet
+        player.bet = 0
+        player.reset(score=0)
+
+
+    def player_reset(self, player, debug=None):
         """boilerplate player reset code"""
-        if debug:
-            print(f"Player {player["name"]} reset")
-        player["busted"] = False
-        player["stand"] = False
-        player["score"] = None
-        player["cards"] = []
+        if debug or (debug is None and self.tracer.reset):
+            self.tracer.emit("reset", player.name, payload="player")
+        player.reset()
 
 
-    def dealer_reset(self, dealer, debug=DEBUG):
+    def dealer_reset(self, dealer, debug=None):
         """boilerplate dealer reset code"""
-        if debug:
-            print(f"Dealer {dealer["name"]} reset")
-        dealer["busted"] = False
-        dealer["stand"] = False
-        dealer["score"] = None
-        dealer["hole_card"] = None
-        dealer["cards"] = []
-
-    def process_turn(self, player, debug=DEBUG):
+        if debug or (debug is None and self.tracer.reset):
+            self.tracer.emit("reset", dealer.name, payload="dealer")
+        dealer.reset()
+
+    def process_turn(self, player, debug=None):
         """boilerplate processing code, safe to use anywhere and twice"""
-        result = self.check_hand(player["cards"])
-        player["score"] = result["score"]
-        if result["busted"]:
+        # running hand state, only cards added since the last call get scored
+        hand = player.hand
+        hand.sync(player.cards)
+        player.score = hand.total
+        if hand.busted:
             self.player_bust(player)
-        else:
-            if debug:
-                # TODO: change flavour text for dealer
-                print(f"\nPlayer {player["name"]} score: {player["score"]}")
-                print(f"{player["cards"]}")
-
-
-    def run_blackjack_console(self, players: list, dealer: dict, deck: list):
-        """contains main game logic for one round"""
-
-        # betting 
-        for player in players:
-            bet_amount = vinput(f"{player["name"]}, please make a bet({player["money"]}$): ",
-                                        pattern=r'^\d+(\.\d+)?$', # integers, floats, decimal point
-                                        condition=lambda t: float(t) <= player['money']).casefold().strip()
-            bet_amount = float(bet_amount)
-            print(player["money"])
-            print(bet_amount <= player["money"])
-            player["bet"] = bet_amount if 0 <= bet_amount <= player["money"] else 0
-            print(f"Player {player["name"]} bet {player["bet"]}\n")
-
-        # initial deal logic
-        self.initial_deal(players, dealer, deck)
-
-        # initial busted and score check TODO: remove busted logic, add dealer 21 logic
-        for player in players:
-            self.process_turn(player)
-
-        remaining_players = [player for player in players if not player["busted"]]
-
-        # reveal house's face-up card prior to player turn
-        print(f"\nDealer has {dealer["cards"][0]} as well as one hidden card")
-        self.process_turn(dealer, debug=False)
-        print(f"Dealer's partial total: {dealer["score"]}")
-
-        # game start, players turn
-        for player in remaining_players:
-            print(f"\nPlayer {player["name"]} you have:"
-                f"\nCash left: {player["money"] - player["bet"]}$"
-                f"\nBet: {player["bet"]}$"
-                f"\nScore: {player["score"]}"
-                f"\n  {player["cards"]}\n"
+        elif debug or (debug is None and self.tracer.turn):
+            # TODO: change flavour text for dealer
+            self.tracer.emit("turn", player.name, player.score, payload=tuple(player.cards))
+
+
+    def run_blackjack_console(self, players: list[Player], dealer: Dealer, deck: Shoe | list):
+        """contains main game logic for one round, a console driver over blackjack_round.Round"""
+        if not players:
+            return
+        game = Round(self, players, dealer, deck)
+
+        def on_bet(player, amount):
+            print(f"Player {player.name} bet {amount}\n")
+
+        def on_dealt(players, dealer):
+            # trace output goes out at the console boundaries, keeps it in order with the prints
+            self.tracer.flush()
+            # reveal house's face-up card prior to player turn
+            print(f"\nDealer has {dealer.cards[0]} as well as one hidden card")
+            print(f"Dealer's partial total: {dealer.score}")
+
+        def on_turn(player):
+            print(f"\nPlayer {player.name} you have:"
+                f"\nCash left: {player.money - player.bet}$"
+                f"\nBet: {player.bet}$"
+                f"\nScore: {player.score}"
+                f"\n  {player.cards}\n"
                 )
             print("Available Actions:\n",
                 "1.Hit\n2.Stand\n3.Double Down\n4.Split\n", sep='')
-            
-            while(not player["stand"]):
-                player_action = vinput("Action: ", pattern=r"^(1|2|3|4|hit|stand|double down|split)$").lower().strip()
-                self.run_action_player(player_action, player, deck) # processes turn as well
-
-        remaining_players = [player for player in players if not player["busted"]]
-
-        # dealers turn
-        print("\n\nDealer's Turn\n")
-        print(f"Dealer's hidden card is {dealer["hole_card"]}")
-        dealer["cards"].append(dealer["hole_card"])
-        self.process_turn(dealer, debug=False)
-        print(f"Dealer has score {dealer["score"]}")
-        print(dealer["cards"], '\n')
-
-        if not dealer["busted"]:
-            print(f"Dealer's total: {dealer["score"]}")
-            while (dealer["score"] < 17 and not dealer["busted"]):
-                self.hit(dealer, deck, 1)
-                self.process_turn(dealer)
-
-        # resolution
-        if not dealer["busted"]:
-            print(f"Dealer's total: {dealer["score"]}")
-            for player in remaining_players:
-                if player["score"] > dealer["score"]:
-                    self.player_win(player)
-                elif player["score"] < dealer["score"]:
-                    self.player_lose(player)
-                else:
-                    print(f"Player {player["name"]} tied with the house")
-                    self.player_reset(player)
-        else:
-            print("\nRemaining players win!")
-            print([player["name"] + " " for player in remaining_players])
-            for player in remaining_players:
-                self.player_win(player)
 
-        for player in players:
-            self.player_reset(player)
+        def on_reveal(dealer):
+            self.tracer.flush()
+            print("\n\nDealer's Turn\n")
+            print(f"Dealer's hidden card is {dealer.hole_card}")
+            print(f"Dealer has score {dealer.score}")
+            print(dealer.cards, '\n')
+            if not dealer.busted:
+                print(f"Dealer's total: {dealer.score}")
+
+        def on_dealer(dealer):
+            self.tracer.flush()
+            if not dealer.busted:
+                print(f"Dealer's total: {dealer.score}")
+            else:
+                print("\nRemaining players win!")
+                print([player.name + " " for player in players if not player.busted])
+
+        def on_result(player, outcome, net):
+            if outcome == "push":
+                self.tracer.flush()
+                print(f"Player {player.name} tied with the house")
+
+        for event, callback in (("bet", on_bet), ("dealt", on_dealt), ("turn", on_turn),
+                                ("reveal", on_reveal), ("dealer", on_dealer), ("result", on_result)):
+            game.on(event, callback)
+
+        # betting
+        while game.state == BETTING:
+            player = game.current
+            bet_amount = vinput(f"{player.name}, please make a bet({player.money}$): ",
+                                        pattern=r'^\d+(\.\d+)?$', # integers, floats, decimal point
+                                        condition=lambda t: float(t) <= player.money).casefold().strip()
+            bet_amount = float(bet_amount)
+            print(player.money)
+            print(bet_amount <= player.money)
+            game.step(bet_amount if 0 <= bet_amount <= player.money else 0) # deals after the last bet
 
-        self.dealer_reset(dealer)
+        # players turn, the dealer and resolution run on their own after the last stand
+        while game.state == PLAYER_TURN:
+            self.tracer.flush()
+            player_action = vinput("Action: ", pattern=r"^(1|2|3|4|hit|stand|double down|split)$").lower().strip()
+            game.step(player_action) # processes turn as well
 
+        self.tracer.flush()
         return
     
-    def refresh_deck(self, modern_variant=False):
-        self.deck = ORIGIN_DECK * 8 if modern_variant else ORIGIN_DECK
+    def refresh_deck(self, modern_variant=None, penetration=None):
+        """
+        shuffled shoe of rules.decks, or 8 / 1 decks when modern_variant is True / False
+
+        The current shoe is reset in place when it has the right size (O(1),
+        no reallocation), otherwise a new one is built.
+        """
+        decks = self.rules.decks if modern_variant is None else 8 if modern_variant else 1
+        penetration = penetration if penetration is not None else self.rules.penetration
+        if isinstance(self.deck, Shoe) and self.deck.decks == decks:
+            self.deck.reset()
+            self.deck.set_cut(penetration)
+        else:
+            self.deck = Shoe(decks, rng=self.rng, penetration=penetration)
+        self.attach_counter()
+
+    def attach_counter(self):
+        """hook self.counter onto the current shoe (no-op without one, or if already there)"""
+        counter = self.counter
+        if counter is None or counter.shoe is self.deck or not isinstance(self.deck, Shoe):
+            return
+        if counter.decks != self.deck.decks:
+            counter.detach()
+            counter = self.counter = counter.resized(self.deck.decks)
+        counter.attach(self.deck)
 
     def main_game_logic(self):
         # example one game with one round
 
-        # get fresh deck
+        # get fresh (already shuffled) deck
         modern_variant = False
-        self.deck = ORIGIN_DECK * 8 if modern_variant else ORIGIN_DECK
+        self.refresh_deck(modern_variant)
 
         # get fresh players list
         self.players = []
 
         # example seat players
-        self.seat_player("Player", float(sys_rand.randint(2000, 8000)), self.players) # type: ignore
+        self.seat_player("Player", float(self.rng.randint(2000, 8000)))
 
         # seat dealer
         self.dealer = self.seat_dealer("Dealer")
 
-        # shuffle deck
-        sys_rand.shuffle(self.deck)
-
-        # start round example
-        # run_blackjack_console(players, new_dealer, deck)
-
         # keep the game rolling
         keep_on = True
         while keep_on:
-            self.run_blackjack_console(self.players, new_dealer, self.deck) # type: ignore
-            if sum([player["money"] for player in self.players]) <= 0.0:
+            self.run_blackjack_console(self.players, self.dealer, self.deck)
+            if sum([player.money for player in self.players]) <= 0.0:
                 return
             keep_on = True if vinput("Keep Playing?(yes/no): ", pattern=r'^(yes|no)$').lower().strip() == "yes" else False
-            self.refresh_deck()
-            sys_rand.shuffle(self.deck) # shuffle
+            # reshuffle only once the cut card is out
+            self.deck.reshuffle_if_cut()
+
+
+def simulate_cli(argv=None) -> int:
+    """
+    Headless bot rounds, streamed as one NDJSON / CSV row per seat per chunk.
+
+    Rows are written and flushed as each chunk finishes and nothing is kept
+    between chunks, so memory stays flat for any number of rounds.
+    """
+    import argparse
+    import csv
+    import json
+    import sys
+    import time
+
+    # bots sit on top of this module, imported here to keep the import one-way
+    from blackjack_bots import BOT_NAMES, iter_session, make_bot
+    from blackjack_rng import make_rng
+
+    parser = argparse.ArgumentParser(prog="python -m blackjack_logic simulate",
+                                     description=simulate_cli.__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=100_000)
+    parser.add_argument("--bot", choices=BOT_NAMES, default="basic")
+    parser.add_argument("--seats", type=int, default=1, help="seats, all played by --bot")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--bet", type=float, default=1.0)
+    parser.add_argument("--budget", type=float, default=1e9, help="starting money per seat")
+    parser.add_argument("--chunk", type=int, default=10_000, help="rounds per output row")
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--out", default="-", help="output file, - for stdout")
+    rules_group = parser.add_argument_group("rules")
+    rules_group.add_argument("--decks", type=int, default=8)
+    rules_group.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    rules_group.add_argument("--double-on", default=None, help="totals allowed to double, e.g. 9,10,11 (default any)")
+    rules_group.add_argument("--no-double-after-hit", action="store_true", help="double on the first two cards only")
+    rules_group.add_argument("--blackjack-pays", type=float, default=1.0, help="natural payout, 1.5 for 3:2")
+    rules_group.add_argument("--penetration", type=float, default=0.75)
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.seats <= 7:
+        parser.error(f"expected 1-7 seats, got {args.seats}")
+    if args.rounds < 1:
+        parser.error(f"expected at least 1 round, got {args.rounds}")
+    if args.chunk < 1:
+        parser.error(f"expected a chunk of at least 1 round, got {args.chunk}")
+    if not 0 < args.bet < float("inf"):
+        parser.error(f"expected a finite bet above 0, got {args.bet}")
+    if not args.bet <= args.budget < float("inf"):
+        parser.error(f"expected a finite --budget covering the {args.bet} bet, got {args.budget}")
+    try:
+        double_on = None if args.double_on is None else tuple(int(total) for total in args.double_on.split(","))
+    except ValueError:
+        parser.error(f"expected --double-on as comma separated totals, got {args.double_on!r}")
+    rules = Rules(decks=args.decks, hit_soft_17=args.h17, double_on=double_on,
+                  double_after_hit=not args.no_double_after_hit,
+                  blackjack_pays=args.blackjack_pays, penetration=args.penetration)
+    try:
+        compile_rules(rules)
+    except ValueError as error:
+        parser.error(str(error))
+
+    rng = make_rng("fast", args.seed)
+    logic = BlackjackLogic(rng=rng, tracer=Tracer(), rules=rules,
+                           counter=CountTracker(rules.decks) if args.bot == "composition" else None)
+    bots = {f"{args.bot}{seat + 1}": make_bot(args.bot, rules, rng) for seat in range(args.seats)}
+
+    fields = ("rounds", "seat", "hands", "net", "wins", "losses", "pushes", "busts",
+              "money", "ev", "total_net", "total_ev", "rounds_per_s")
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="")
+    try:
+        writer = csv.DictWriter(out, fields) if args.format == "csv" else None
+        if writer is not None:
+            writer.writeheader()
+        totals = dict.fromkeys(bots, 0.0)
+        start, last = time.perf_counter(), 0
+        for done, chunk in iter_session(bots, args.rounds, args.chunk, args.bet, budget=args.budget,
+                                        seed=args.seed, logic=logic, rules=rules):
+            speed = done / (time.perf_counter() - start)
+            hands = done - last
+            for name, seat in chunk.items():
+                totals[name] += seat["net"]
+                row = {"rounds": done, "seat": name, "hands": hands, **seat,
+                       "ev": seat["net"] / (hands * args.bet), "total_net": totals[name],
+                       "total_ev": totals[name] / (done * args.bet), "rounds_per_s": round(speed, 1)}
+                if writer is not None:
+                    writer.writerow(row)
+                else:
+                    out.write(json.dumps(row) + "\n")
+            out.flush()
+            last = done
+    except ValueError as error: # a seat ran out of money mid-run, rows so far are written
+        print(f"simulate: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
 
 
 if __name__ == "__main__":
+    import sys
+
+    if sys.argv[1:2] == ["simulate"]:
+        sys.exit(simulate_cli(sys.argv[2:]))
     blackjack_table = BlackjackLogic()
-    blackjack_table.main_game_logic()
\ No newline at end of file
+    blackjack_table.main_game_logic()
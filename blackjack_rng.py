@@ -0,0 +1,119 @@
+"""
+Pluggable RNG layer for shuffling and dealing.
+
+Two modes, same random.Random-style surface (shuffle, randrange, randint,
+uniform, random, choice):
+    "crypto" - random.SystemRandom, OS entropy pool, not seedable (live play)
+    "fast"   - FastRandom, NumPy PCG64, seedable, draws numbers and whole
+               shuffles in bulk ahead of time (simulation, replays)
+
+BlackjackLogic, Shoe and the Ursina client (preload_deck, TornadoController)
+take their RNG from get_rng() unless one is passed in explicitly.
+"""
+import random
+from array import array
+
+MODES = ("crypto", "fast")
+
+_default_rng = None
+
+
+class FastRandom:
+    """
+    Seedable PCG64 generator with pre-drawn batches.
+
+    Uniform floats and full permutations are generated `batch` at a time with
+    NumPy and handed out one by one, so per-call cost is a list index.
+    """
+    def __init__(self, seed=None, batch: int = 4096):
+        import numpy as np # only the fast mode needs numpy
+
+        self._np = np
+        self.seed = seed
+        self.batch = batch
+        self.generator = np.random.Generator(np.random.PCG64(seed))
+
+        self._floats = []
+        self._float_pos = 0
+        self._perms = {} # length -> [pre-drawn permutations, next index]
+
+    def random(self) -> float:
+        """float in [0, 1)"""
+        if self._float_pos >= len(self._floats):
+            self._floats = self.generator.random(self.batch).tolist()
+            self._float_pos = 0
+        value = self._floats[self._float_pos]
+        self._float_pos += 1
+        return value
+
+    def randrange(self, stop: int) -> int:
+        """int in [0, stop)"""
+        if stop <= 0:
+            raise ValueError(f"empty range for randrange({stop})")
+        return int(self.random() * stop)
+
+    def randint(self, a: int, b: int) -> int:
+        """int in [a, b], both included"""
+        return a + self.randrange(b - a + 1)
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq):
+        return seq[self.randrange(len(seq))]
+
+    def permutation(self, n: int) -> list[int]:
+        """random ordering of range(n), taken from a bulk pre-drawn pool"""
+        pool = self._perms.get(n)
+        if pool is None or pool[1] >= len(pool[0]):
+            # fewer rows for long sequences, keeps the pool around 64k ints
+            rows = max(1, min(self.batch, 65536 // max(n, 1)))
+            base = self._np.tile(self._np.arange(n, dtype=self._np.int32), (rows, 1))
+            pool = self._perms[n] = [self.generator.permuted(base, axis=1).tolist(), 0]
+        perm = pool[0][pool[1]]
+        pool[1] += 1
+        return perm
+
+    def shuffle(self, seq):
+        """shuffle a list or array in place"""
+        items = list(seq)
+        shuffled = [items[i] for i in self.permutation(len(items))]
+        if isinstance(seq, array):
+            seq[:] = array(seq.typecode, shuffled)
+        else:
+            seq[:] = shuffled
+
+    def __repr__(self) -> str:
+        return f"FastRandom(seed={self.seed!r})"
+
+
+def make_rng(mode: str = "crypto", seed=None):
+    """
+    Build an RNG for the given mode.
+
+    Args:
+        mode: "crypto" for live play, "fast" for seedable bulk draws.
+        seed: Seed for the fast mode, the crypto mode can't be seeded.
+    """
+    if mode == "crypto":
+        if seed is not None:
+            raise ValueError("crypto mode can't be seeded, use mode='fast'")
+        # real randomness from the OS entropy pool
+        return random.SystemRandom()
+    if mode == "fast":
+        return FastRandom(seed)
+    raise ValueError(f"Expected mode in {MODES}, got {mode!r}")
+
+
+def get_rng():
+    """process-wide default RNG, crypto mode unless set_rng() was called"""
+    global _default_rng
+    if _default_rng is None:
+        _default_rng = make_rng("crypto")
+    return _default_rng
+
+
+def set_rng(rng):
+    """swap the process-wide default RNG, e.g. set_rng(make_rng("fast", 42))"""
+    global _default_rng
+    _default_rng = rng
@@ -0,0 +1,261 @@
+"""
+Step-driven round state machine over BlackjackLogic.
+
+    BETTING -> DEALING -> PLAYER_TURN -> DEALER_TURN -> RESOLVED
+
+A Round only stops where it needs input: a bet (BETTING) or an action from
+the current player (PLAYER_TURN). step() feeds that input and runs every
+automatic state after it (dealing, the dealer's draws, resolution) before
+returning, so nothing ever blocks or polls. What happens along the way is
+reported through callbacks registered with on():
+
+    "state"   (state)                   every state change
+    "bet"     (player, amount)
+    "dealt"   (players, dealer)         initial deal done, dealer shows cards[0]
+    "turn"    (player)                  player's turn starts
+    "action"  (player, action)          action applied, hand updated
+    "reveal"  (dealer)                  hole card turned over
+    "dealer"  (dealer)                  dealer done drawing
+    "result"  (player, outcome, net)    outcome in "win" / "lose" / "push" / "bust"
+
+Same flow and resolution as run_blackjack_console, which is now a thin
+driver over this, and the same journal / stats calls when logic.journal or
+logic.stats is set.
+
+snapshot() / restore() save and roll back the whole round (state, seats,
+shoe cursor, counter) in time independent of the shoe size, so rollouts can
+be played from a decision point and undone (see blackjack_bots.rollout_evs).
+"""
+from blackjack_journal import PUSH
+from blackjack_shoe import Shoe
+
+BETTING = "betting"
+DEALING = "dealing"
+PLAYER_TURN = "player_turn"
+DEALER_TURN = "dealer_turn"
+RESOLVED = "resolved"
+STATES = (BETTING, DEALING, PLAYER_TURN, DEALER_TURN, RESOLVED)
+
+EVENTS = ("state", "bet", "dealt", "turn", "action", "reveal", "dealer", "result")
+
+
+class Round:
+    """
+    One table's rounds, reusable: new_round() goes back to BETTING.
+
+    Args:
+        logic: BlackjackLogic doing the dealing, scoring and payouts.
+        players: Seats playing the round, in turn order.
+        dealer: The table's Dealer.
+        deck: Shoe (or card list) to deal from, logic.deck by default.
+    """
+    def __init__(self, logic, players: list, dealer, deck=None):
+        self.logic = logic
+        self.dealer = dealer
+        self.deck = deck if deck is not None else logic.deck
+        self.listeners = {event: [] for event in EVENTS}
+        self.new_round(players)
+
+    # ---- events -----------------------------------------------------------
+    def on(self, event: str, callback):
+        """register callback(*args) for `event`, returns the callback"""
+        if event not in self.listeners:
+            raise ValueError(f"Expected an event in {EVENTS}, got {event!r}")
+        self.listeners[event].append(callback)
+        return callback
+
+    def emit(self, event: str, *args):
+        for callback in self.listeners[event]:
+            callback(*args)
+
+    def _set_state(self, state: str):
+        self.state = state
+        self.emit("state", state)
+
+    # ---- snapshots --------------------------------------------------------
+    def snapshot(self) -> tuple:
+        """
+        Flat tuple for restore(). The shoe part is O(1) for a Shoe (a card
+        list deck is copied) and only valid until the shoe is reshuffled.
+        """
+        deck, counter = self.deck, self.logic.counter
+        return (
+            self.state, self.current, self._turn, tuple(self.players),
+            tuple(self.bets.items()), tuple(self.start_money.items()),
+            deck.snapshot() if isinstance(deck, Shoe) else tuple(deck),
+            counter.snapshot() if counter is not None else None,
+            tuple(player.snapshot() for player in self.players),
+            self.dealer.snapshot(),
+        )
+
+    def restore(self, snapshot: tuple):
+        """back to a snapshot(), no callbacks fire"""
+        (self.state, self.current, self._turn, players, bets, start_money,
+         deck, counter, seats, dealer) = snapshot
+        self.players[:] = players
+        self.bets = dict(bets)
+        self.start_money = dict(start_money)
+        if isinstance(self.deck, Shoe):
+            self.deck.restore(deck)
+        else:
+            self.deck[:] = deck
+        if counter is not None:
+            self.logic.counter.restore(counter)
+        for player, seat in zip(players, seats):
+            player.restore(seat)
+        self.dealer.restore(dealer)
+
+    # ---- input ------------------------------------------------------------
+    def new_round(self, players: list | None = None):
+        """back to BETTING, with a new seat list if given"""
+        if players is not None:
+            self.players = list(players)
+        self.bets = {}
+        self.start_money = {}
+        self.current = self.players[0] if self.players else None
+        self._turn = -1
+        self._set_state(BETTING)
+
+    @property
+    def waiting(self) -> bool:
+        """True while the round needs a step() to go on"""
+        return self.state in (BETTING, PLAYER_TURN)
+
+    def step(self, action, player=None) -> str:
+        """
+        Feed the input the round is waiting on, returns the new state.
+
+        Args:
+            action: Bet amount in BETTING, action ('hit', 'stand', 'double down',
+                    or '1'-'3') in PLAYER_TURN.
+            player: Who it's from, the current seat by default. Bets can come
+                    in any order, actions only from the player whose turn it is.
+        """
+        player = player if player is not None else self.current
+        if self.state == BETTING:
+            self._bet(player, action)
+        elif self.state == PLAYER_TURN:
+            self._act(player, action)
+        else:
+            raise ValueError(f"Expected a round waiting on input, got state {self.state!r}")
+        return self.state
+
+    def add(self, player):
+        """seat joins: plays this round if bets are still open, else waits for new_round()"""
+        if self.state == BETTING and player not in self.players:
+            self.players.append(player)
+            if self.current is None:
+                self.current = player
+
+    def remove(self, player):
+        """seat left: dropped before the deal, stands if it's mid-round"""
+        if self.state == BETTING:
+            if player in self.players:
+                self.players.remove(player)
+                self.bets.pop(player, None)
+            if self.players and len(self.bets) == len(self.players):
+                self._deal()
+            else:
+                self.current = next((seat for seat in self.players if seat not in self.bets), None)
+        elif player in self.players and not player.stand:
+            player.stand = True
+            if player is self.current:
+                self._next_turn()
+
+    def _bet(self, player, amount):
+        if player not in self.players:
+            raise ValueError(f"Expected a seated player, got {player!r}")
+        if player in self.bets:
+            raise ValueError(f"Player {player.name} already bet {self.bets[player]}")
+        amount = float(amount)
+        if not 0 <= amount <= player.money:
+            raise ValueError(f"Expected a bet in [0, {player.money}], got {amount}")
+
+        player.bet = amount
+        self.bets[player] = amount
+        self.emit("bet", player, amount)
+        if len(self.bets) == len(self.players):
+            self._deal()
+        else:
+            self.current = next(seat for seat in self.players if seat not in self.bets)
+
+    def _act(self, player, action):
+        if player is not self.current:
+            raise ValueError(f"Expected an action from {self.current.name}, got one from {player.name}")
+        action = str(action).casefold().strip()
+        if self.logic.run_action_player(action, player, self.deck) == "not_mapped":
+            raise ValueError(f"Expected hit, stand or double down, got {action!r}")
+        self.emit("action", player, action)
+        if player.stand:
+            self._next_turn()
+
+    # ---- automatic states -------------------------------------------------
+    def _deal(self):
+        self._set_state(DEALING)
+        logic, dealer = self.logic, self.dealer
+        for player in self.players:
+            self.start_money[player] = player.money
+        if logic.journal is not None:
+            logic.journal.begin_round(self.players, dealer, logic.rules.blackjack_pays)
+        if logic.stats is not None:
+            logic.stats.begin_round(self.players, dealer)
+
+        logic.initial_deal(self.players, dealer, self.deck)
+        # initial busted and score check
+        for player in self.players:
+            logic.process_turn(player)
+        logic.process_turn(dealer, debug=False)
+        self.emit("dealt", self.players, dealer)
+        self._next_turn()
+
+    def _next_turn(self):
+        """next seat still playing, or the dealer"""
+        while self._turn + 1 < len(self.players):
+            self._turn += 1
+            player = self.players[self._turn]
+            if not player.busted and not player.stand:
+                self.current = player
+                self._set_state(PLAYER_TURN)
+                self.emit("turn", player)
+                return
+        self.current = None
+        self._dealer_turn()
+
+    def _dealer_turn(self):
+        self._set_state(DEALER_TURN)
+        logic, dealer = self.logic, self.dealer
+        dealer.cards.append(dealer.hole_card)
+        logic.process_turn(dealer, debug=False)
+        self.emit("reveal", dealer)
+
+        logic.compiled.play_dealer(logic, dealer, self.deck) # soft 17 per logic.rules
+        self.emit("dealer", dealer)
+        self._resolve()
+
+    def _resolve(self):
+        logic, dealer, journal = self.logic, self.dealer, self.logic.journal
+        for player in self.players:
+            if player.busted:
+                outcome = "bust" # already settled by player_bust
+            elif dealer.busted or player.score > dealer.score:
+                outcome = "win"
+                logic.player_win(player)
+            elif player.score < dealer.score:
+                outcome = "lose"
+                logic.player_lose(player)
+            else:
+                outcome = "push"
+                if journal is not None:
+                    journal.result(player, PUSH, 0)
+                if logic.stats is not None:
+                    logic.stats.result(player, PUSH, 0)
+            self.emit("result", player, outcome, player.money - self.start_money[player])
+
+        for player in self.players:
+            logic.player_reset(player)
+        logic.dealer_reset(dealer)
+        if journal is not None:
+            journal.end_round()
+        if logic.stats is not None:
+            logic.stats.end_round()
+        self._set_state(RESOLVED)
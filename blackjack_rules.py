@@ -0,0 +1,114 @@
+"""
+Table rules.
+
+Rules is an immutable, hashable rule set: shoe size, soft 17, when doubling
+is allowed, natural payout and penetration. The defaults are the rules the
+game has always played (1 deck, dealer stands on all 17, double on any hand,
+naturals pay 1:1).
+
+compile_rules() turns a Rules into RuleTables once (cached per rule set):
+flat lookup tables for "does the dealer draw", "may this hand double" and
+"what does a win pay", so per-round code indexes a tuple instead of
+branching on rule flags. Strategy and simulation caches key on the Rules
+itself.
+"""
+from typing import NamedTuple
+
+from blackjack_shoe import CARDS_PER_DECK
+
+DEALER_STANDS_ON = 17
+MAX_HARD = 31 # highest hard total a hand can reach (20 + a ten), table size
+MAX_DECKS = 15 # 16 ten-valued cards per deck must fit the solvers' 8 bit counts (blackjack_dealer.pack_shoe)
+
+_compiled = {} # Rules -> RuleTables
+
+
+class Rules(NamedTuple):
+    decks: int = 1
+    hit_soft_17: bool = False         # H17, dealer draws to soft 17; False = S17
+    double_on: tuple | None = None    # player totals allowed to double, None = any
+    double_after_hit: bool = True     # double with any number of cards, else first two only
+    blackjack_pays: float = 1.0       # two-card 21 win payout per bet unit, 1.5 for 3:2
+    penetration: float = 0.75         # shoe fraction dealt before the cut card
+
+    @classmethod
+    def modern(cls, **changes) -> "Rules":
+        """8 deck shoe, the old `modern_variant` flag"""
+        return cls(decks=8, **changes)
+
+    def key(self) -> str:
+        """stable text form, for file names and cache keys outside the process"""
+        double_on = "any" if self.double_on is None else "-".join(map(str, sorted(self.double_on)))
+        return (f"d{self.decks}-{'h17' if self.hit_soft_17 else 's17'}-dbl{double_on}"
+                f"-{'da' if self.double_after_hit else 'd2'}-bj{self.blackjack_pays:g}-pen{self.penetration:g}")
+
+
+def validate_rules(rules: Rules):
+    if not isinstance(rules.decks, int) or not 1 <= rules.decks <= MAX_DECKS:
+        raise ValueError(f"Expected 1-{MAX_DECKS} decks, got {rules.decks!r}")
+    if not 0.0 < rules.penetration <= 1.0:
+        raise ValueError(f"Expected penetration in (0, 1], got {rules.penetration}")
+    if int(rules.decks * CARDS_PER_DECK * rules.penetration) < 1: # Shoe.set_cut's cut card position
+        raise ValueError(f"Expected penetration dealing at least 1 card of {rules.decks} deck(s), "
+                         f"got {rules.penetration}")
+    if rules.blackjack_pays < 0:
+        raise ValueError(f"Expected a non-negative blackjack payout, got {rules.blackjack_pays}")
+    if rules.double_on is not None and not isinstance(rules.double_on, tuple):
+        raise ValueError(f"Expected double_on as a tuple or None, got {rules.double_on!r}")
+    if rules.double_on is not None and not all(2 <= total <= 21 for total in rules.double_on):
+        raise ValueError(f"Expected double_on totals in 2-21, got {rules.double_on}")
+
+
+class RuleTables:
+    """
+    Lookup tables for one Rules, built by compile_rules().
+
+    dealer_hits[(hard << 1) | has_ace]      dealer draws another card
+    double_ok[two_cards][total]             hand may double (money aside)
+    win_payout[natural]                     win paid per bet unit
+    """
+    __slots__ = ("rules", "dealer_hits", "double_ok", "win_payout")
+
+    def __init__(self, rules: Rules):
+        validate_rules(rules)
+        self.rules = rules
+
+        hits = []
+        for hard in range(MAX_HARD + 1):
+            for ace in (False, True):
+                soft = ace and hard + 10 <= 21
+                total = hard + 10 if soft else hard
+                hits.append(total < DEALER_STANDS_ON
+                            or (rules.hit_soft_17 and soft and total == DEALER_STANDS_ON))
+        self.dealer_hits = tuple(hits)
+
+        allowed = tuple(rules.double_on is None or total in rules.double_on for total in range(MAX_HARD + 1))
+        self.double_ok = (allowed if rules.double_after_hit else (False,) * (MAX_HARD + 1), allowed)
+        self.win_payout = (1.0, rules.blackjack_pays)
+
+    def dealer_draws(self, hand) -> bool:
+        """dealer hits on this blackjack_hand.Hand"""
+        return self.dealer_hits[(hand.hard << 1) | (hand.aces > 0)] if hand.hard <= MAX_HARD else False
+
+    def play_dealer(self, logic, dealer, deck):
+        """draw for `dealer` (hole card already revealed and scored) until the rules say stop"""
+        hits, hand = self.dealer_hits, dealer.hand
+        while hits[(hand.hard << 1) | (hand.aces > 0)]: # busted hands never draw
+            logic.hit(dealer, deck, 1)
+            logic.process_turn(dealer)
+
+    def __repr__(self) -> str:
+        return f"RuleTables({self.rules!r})"
+
+
+def compile_rules(rules: Rules | None = None) -> RuleTables:
+    """RuleTables for `rules` (default Rules()), built once per rule set"""
+    rules = rules if rules is not None else Rules()
+    try:
+        tables = _compiled.get(rules)
+    except TypeError: # a list somewhere, validation says where
+        validate_rules(rules)
+        raise
+    if tables is None:
+        tables = _compiled[rules] = RuleTables(rules)
+    return tables
@@ -0,0 +1,121 @@
+"""
+Slotted seat types for BlackjackLogic.
+
+Player / Dealer replace the per-seat dicts from seat_player / seat_dealer.
+Fields are plain slot attributes (seat.cards, seat.score, ...) and resets
+happen in place, the card list and Hand are reused round after round.
+
+Seats still answer seat["cards"], seat.get("score"), seat.items() etc. so
+main.py's GameBlackjack (and anything else written against the old dicts)
+keeps working unchanged.
+
+snapshot() / restore() save a seat as one flat tuple (bankroll, bet, flags,
+the Hand's ints and the few cards held), for rollouts from a live round.
+"""
+import math
+
+from blackjack_hand import Hand
+
+
+class Seat:
+    """common seat state, with a dict-compatible view over the slots"""
+    __slots__ = ("name", "money", "bet", "cards", "hand", "score", "stand", "busted")
+    FIELDS = __slots__
+
+    def __init__(self, name: str, money: float, bet: float | None = None, score: int | None = None):
+        self.name = name
+        self.money = money
+        self.bet = bet
+        self.cards = []
+        self.hand = Hand() # running score state for process_turn()
+        self.score = score
+        self.stand = False # indicates turn is over
+        self.busted = False
+
+    def reset(self, score: int | None = None):
+        """clear the hand for a new round, no reallocation"""
+        self.cards.clear()
+        self.hand.reset()
+        self.score = score
+        self.stand = False
+        self.busted = False
+
+    def snapshot(self) -> tuple:
+        hand = self.hand
+        return (self.money, self.bet, tuple(self.cards), self.score, self.stand, self.busted,
+                hand.hard, hand.aces, hand.count)
+
+    def restore(self, snapshot: tuple):
+        """back to a snapshot(), the card list and Hand objects are kept"""
+        (self.money, self.bet, cards, self.score, self.stand, self.busted,
+         hard, aces, count) = snapshot[:9]
+        self.cards[:] = cards
+        hand = self.hand
+        hand.hard, hand.aces, hand.count = hard, aces, count
+        hand._source = self.cards # in sync with the restored cards
+
+    # ---- dict view --------------------------------------------------------
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key) -> bool:
+        return key in self.FIELDS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.FIELDS else default
+
+    def keys(self):
+        return self.FIELDS
+
+    def values(self):
+        return [getattr(self, key) for key in self.FIELDS]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.FIELDS]
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()})"
+
+
+class Player(Seat):
+    __slots__ = ()
+
+    def __init__(self, name: str, budget: float):
+        super().__init__(name, budget)
+
+
+class Dealer(Seat):
+    __slots__ = ("hole_card",)
+    FIELDS = Seat.FIELDS + __slots__
+
+    def __init__(self, name: str):
+        # bet 0 is a placeholder to avoid errors
+        super().__init__(name, math.inf, bet=0, score=0)
+        self.hole_card = None
+
+    def reset(self, score: int | None = None):
+        super().reset(score)
+        self.hole_card = None
+
+    def snapshot(self) -> tuple:
+        return super().snapshot() + (self.hole_card,)
+
+    def restore(self, snapshot: tuple):
+        super().restore(snapshot)
+        self.hole_card = snapshot[9]
@@ -0,0 +1,269 @@
+"""
+Multi-table asyncio game server around BlackjackLogic.
+
+One process hosts any number of tables. Each table is a blackjack_round.Round
+state machine: it sits in BETTING or PLAYER_TURN until a message arrives,
+and the message is stepped through it synchronously the moment its line is
+read off the socket. Tables have no task, thread or queue of their own, an
+idle table is just its Round, seats and shoe.
+
+Protocol: newline-delimited JSON over a local TCP port or a unix socket.
+    -> {"op": "join", "table": "t1", "name": "ana", "budget": 1000}
+    -> {"op": "bet", "amount": 100}
+    -> {"op": "action", "action": "hit"}     (hit / stand / double down, or 1-3)
+    -> {"op": "leave"}
+    <- {"event": ...} messages: joined, bet, deal, turn, hand, dealer, result, error
+
+Run with:
+    python -m blackjack_server [--port 8765 | --unix /tmp/blackjack.sock] [--decks 8] [--seats 5]
+"""
+import argparse
+import asyncio
+import json
+import math
+
+from blackjack_logic import BlackjackLogic
+from blackjack_round import Round, BETTING, DEALING, RESOLVED
+from blackjack_shoe import CARDS_PER_DECK, Shoe
+from blackjack_trace import Tracer
+
+# cards kept in the shoe per hand (seats + dealer) before a round starts,
+# way above what a hand ever takes, so a round can't run the shoe dry
+CARDS_PER_HAND = 8
+
+
+class Table:
+    """
+    One table: seats, dealer, shoe and the Round driving them.
+
+    Joins / leaves update the seat list and the round, bets and actions go
+    straight to Round.step(); whatever the round does in response comes back
+    through its callbacks and is broadcast to the seats.
+    """
+    def __init__(self, table_id: str, decks: int = 8, max_seats: int = 7,
+                 rng=None, tracer: Tracer | None = None):
+        seat_cap = decks * CARDS_PER_DECK // CARDS_PER_HAND - 1
+        if not 1 <= max_seats <= seat_cap:
+            raise ValueError(f"Expected 1 to {seat_cap} seats for a {decks} deck shoe, got {max_seats}")
+        self.table_id = table_id
+        self.max_seats = max_seats
+        self.logic = BlackjackLogic(rng=rng, tracer=tracer if tracer is not None else Tracer())
+        self.logic.deck = Shoe(decks, rng=self.logic.rng)
+        self.dealer = self.logic.seat_dealer("Dealer")
+        self.seats = {} # Player -> send(event)
+        self.rounds = 0
+
+        self.round = Round(self.logic, [], self.dealer)
+        for event, callback in (("state", self.on_state), ("bet", self.on_bet), ("dealt", self.on_dealt),
+                                ("turn", self.on_turn), ("action", self.on_action),
+                                ("dealer", self.on_dealer), ("result", self.on_result)):
+            self.round.on(event, callback)
+
+    # ---- seats ------------------------------------------------------------
+    def join(self, name: str, budget, send):
+        if len(self.seats) >= self.max_seats:
+            raise ValueError(f"Table {self.table_id} is full ({self.max_seats} seats)")
+        try:
+            money = float(budget)
+        except (TypeError, ValueError):
+            money = math.nan
+        if not (math.isfinite(money) and money > 0):
+            raise ValueError(f"Expected a finite budget above 0, got {budget!r}")
+        player = self.logic.seat_player(name, money)
+        self.seats[player] = send
+        send({"event": "joined", "table": self.table_id, "name": name, "money": player.money})
+        self.round.add(player)
+        return player
+
+    def leave(self, player):
+        if self.seats.pop(player, None) is not None:
+            if player in self.logic.players:
+                self.logic.players.remove(player)
+            self.round.remove(player)
+            self.next_round()
+
+    def handle(self, player, message: dict):
+        """apply one client message"""
+        op = message.get("op")
+        if op == "leave":
+            self.leave(player)
+            return
+        if op not in ("bet", "action"):
+            self.error(player, f"Expected op bet, action or leave, got {op!r}")
+            return
+
+        state = self.round.state
+        if op == "bet" and state != BETTING:
+            self.error(player, "Round in progress, bets open after it")
+        elif op == "action" and state == BETTING:
+            self.error(player, "No round in progress, place a bet")
+        elif op == "bet":
+            try:
+                amount = float(message.get("amount"))
+            except (TypeError, ValueError):
+                amount = -1.0
+            if not 0 < amount <= player.money:
+                self.error(player, f"Expected a bet in (0, {player.money}], got {message.get('amount')!r}")
+                return
+            self.step(player, amount)
+        else:
+            self.step(player, message.get("action", ""))
+
+    def step(self, player, action):
+        try:
+            self.round.step(action, player)
+        except ValueError as e:
+            self.error(player, str(e))
+        self.next_round()
+
+    def next_round(self):
+        """reopen bets once a round is resolved, seats out of money sit out (a round waits on every bet)"""
+        if self.round.state == RESOLVED:
+            self.rounds += 1
+            for player in self.round.players:
+                if player.money <= 0 and player in self.seats:
+                    self.error(player, "Out of money, sitting out until you leave")
+            self.round.new_round([player for player in self.seats if player.money > 0])
+
+    # ---- events -----------------------------------------------------------
+    def send(self, player, event: dict):
+        send = self.seats.get(player)
+        if send is not None:
+            send(event)
+
+    def error(self, player, message: str):
+        self.send(player, {"event": "error", "message": message})
+
+    def broadcast(self, event: dict):
+        for send in self.seats.values():
+            send(event)
+
+    def on_state(self, state: str):
+        deck = self.logic.deck
+        if state == DEALING and not deck.reshuffle_if_cut() \
+                and len(deck) < CARDS_PER_HAND * (len(self.round.players) + 1):
+            deck.reset()
+
+    def on_bet(self, player, amount: float):
+        self.broadcast({"event": "bet", "name": player.name, "amount": amount})
+
+    def on_dealt(self, players: list, dealer):
+        self.broadcast({"event": "deal", "dealer": dealer.cards[0],
+                        "hands": {player.name: list(player.cards) for player in players}})
+
+    def on_turn(self, player):
+        self.broadcast({"event": "turn", "name": player.name, "score": player.score})
+
+    def on_action(self, player, action: str):
+        self.broadcast({"event": "hand", "name": player.name, "cards": list(player.cards),
+                        "score": player.score, "busted": player.busted, "bet": player.bet})
+
+    def on_dealer(self, dealer):
+        self.broadcast({"event": "dealer", "cards": list(dealer.cards),
+                        "score": dealer.score, "busted": dealer.busted})
+
+    def on_result(self, player, outcome: str, net: float):
+        self.broadcast({"event": "result", "name": player.name, "outcome": outcome,
+                        "net": net, "money": player.money})
+
+
+class TableServer:
+    """
+    Routes socket connections to tables, creating tables on first join and
+    dropping them when the last seat leaves.
+    """
+    def __init__(self, decks: int = 8, max_seats: int = 7, rng=None, tracer: Tracer | None = None):
+        self.decks = decks
+        self.max_seats = max_seats
+        self.rng = rng
+        self.tracer = tracer if tracer is not None else Tracer() # one ring for every table
+        self.tables = {}
+        self.server = None
+
+    def table(self, table_id: str) -> Table:
+        table = self.tables.get(table_id)
+        if table is None:
+            table = self.tables[table_id] = Table(table_id, self.decks, self.max_seats,
+                                                  rng=self.rng, tracer=self.tracer)
+        return table
+
+    def close_if_empty(self, table: Table):
+        if not table.seats:
+            self.tables.pop(table.table_id, None)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, unix_path: str | None = None):
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self.serve_client, path=unix_path)
+        else:
+            self.server = await asyncio.start_server(self.serve_client, host, port)
+        return self.server
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """one connection = one seat"""
+        def send(event: dict):
+            writer.write(json.dumps(event).encode() + b"\n")
+
+        table = player = None
+        try:
+            while line := await reader.readline():
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    send({"event": "error", "message": "Expected one JSON object per line"})
+                    continue
+                if not isinstance(message, dict):
+                    send({"event": "error", "message": "Expected one JSON object per line"})
+                    continue
+
+                if player is None:
+                    if message.get("op") != "join":
+                        send({"event": "error", "message": "Join a table first"})
+                        continue
+                    table = self.table(str(message.get("table", "default")))
+                    try:
+                        player = table.join(str(message.get("name", "Player")),
+                                            message.get("budget", 1000), send)
+                    except ValueError as e:
+                        send({"event": "error", "message": str(e)})
+                        self.close_if_empty(table)
+                        table = None
+                elif message.get("op") == "join":
+                    send({"event": "error", "message": f"Already seated at {table.table_id}"})
+                else:
+                    table.handle(player, message)
+                    if message.get("op") == "leave":
+                        self.close_if_empty(table)
+                        table = player = None
+
+                if writer.transport.get_write_buffer_size() > 1 << 16:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if player is not None:
+                table.leave(player)
+                self.close_if_empty(table)
+            writer.close()
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description="Blackjack multi-table server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="serve on a unix socket path instead of TCP")
+    parser.add_argument("--decks", type=int, default=8)
+    parser.add_argument("--seats", type=int, default=5, help="seats per table")
+    args = parser.parse_args(argv)
+
+    server = TableServer(decks=args.decks, max_seats=args.seats)
+    await server.start(args.host, args.port, args.unix)
+    print(f"serving on {args.unix or f'{args.host}:{args.port}'}")
+    await server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
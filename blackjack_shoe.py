@@ -0,0 +1,239 @@
+"""
+Integer-encoded card shoe for BlackjackLogic.
+
+Cards are stored as small ints in a preallocated array('b') buffer:
+    code = rank * 4 + suit   (0..51)
+Drawing reads the buffer at a cursor and advances it, O(1), no list scans.
+
+The buffer is shuffled lazily (Fisher-Yates, one swap per draw), so a
+reshuffle is just rewinding the cursor: O(1), nothing reallocated. A cut
+card at `penetration` of the shoe tells the table when to reshuffle between
+rounds, like a casino shoe.
+
+Observers (e.g. blackjack_count.CountTracker) get on_draw(code) for every
+card dealt, on_return(code) for put_back() and on_reset() on every reshuffle.
+
+snapshot() / restore() are O(1): draws only ever swap cards at or after the
+cursor, so the dealt part of the buffer and the multiset of cards left
+never change, and rewinding the cursor restores the shoe. A lazily shuffled
+shoe comes back with the same cards left in a fresh random order, which is
+the same shoe as far as any later draw can tell.
+
+Names match the Ursina client texture names ("QH", "10C", ...), which is what
+main.py puts in custom_class_param["name"], so hands stay interchangeable.
+"""
+from array import array
+
+from blackjack_rng import get_rng
+
+# rank / suit codes, order matches blackjack_logic RANKS / SUITS
+RANK_NAMES = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUIT_NAMES = ('S', 'C', 'H', 'D') # ♠️ ♣️ ♥️ ♦️
+ACE_RANK = RANK_NAMES.index('A')
+
+CARDS_PER_DECK = len(RANK_NAMES) * len(SUIT_NAMES)
+
+# code -> client name and back
+CARD_NAMES = tuple(rank + suit for rank in RANK_NAMES for suit in SUIT_NAMES)
+CARD_CODES = {name: code for code, name in enumerate(CARD_NAMES)}
+
+
+def card_rank(code: int) -> int:
+    """rank index (0 = '2' ... 12 = 'A')"""
+    return code >> 2
+
+
+def card_suit(code: int) -> int:
+    """suit index into SUIT_NAMES"""
+    return code & 3
+
+
+def card_name(code: int) -> str:
+    """client name for a card code, e.g. 42 -> 'QH'"""
+    return CARD_NAMES[code]
+
+
+def card_code(name: str) -> int:
+    """card code for a client name, e.g. 'QH' -> 42"""
+    return CARD_CODES[name]
+
+
+class Shoe:
+    """
+    Multi-deck int8 card buffer with a draw cursor and a cut card.
+
+    Cards before the cursor are dealt, cards from the cursor on are still
+    in the shoe (in no particular order while the shoe is shuffled lazily).
+    """
+    __slots__ = ("decks", "cards", "cursor", "rng", "cut", "observers", "epoch", "_lazy")
+
+    def __init__(self, decks: int = 1, rng=None, penetration: float = 0.75, cut_card: int | None = None):
+        """
+        Args:
+            decks: Number of 52 card decks.
+            rng: Random source, get_rng() by default (see blackjack_rng).
+            penetration: Fraction of the shoe dealt before the cut card comes out.
+            cut_card: Exact cut card position (cards dealt before it), overrides penetration.
+        """
+        if decks < 1:
+            raise ValueError(f"Expected at least 1 deck, got {decks}")
+        self.decks = decks
+        self.rng = rng if rng is not None else get_rng()
+        self.cards = array('b', range(CARDS_PER_DECK)) * decks
+        self.cursor = 0
+        self.observers = []
+        self.epoch = 0 # reset() count, snapshots don't survive a reshuffle
+        self._lazy = True
+        self.set_cut(penetration, cut_card)
+
+    @classmethod
+    def from_codes(cls, codes, rng=None, shuffled: bool = False) -> "Shoe":
+        """
+        Shoe holding exactly `codes`.
+
+        Dealt in that order (replays, scripted rounds) unless `shuffled`; after
+        a reset() it's a normal shuffled shoe either way.
+        """
+        shoe = cls.__new__(cls)
+        shoe.decks = max(1, -(-len(codes) // CARDS_PER_DECK))
+        shoe.rng = rng if rng is not None else get_rng()
+        shoe.cards = array('b', codes)
+        shoe.cursor = 0
+        shoe.observers = []
+        shoe.epoch = 0
+        shoe._lazy = shuffled
+        shoe.cut = len(shoe.cards)
+        return shoe
+
+    def set_cut(self, penetration: float = 0.75, cut_card: int | None = None):
+        """place the cut card, by penetration or exact position"""
+        size = len(self.cards)
+        if cut_card is None:
+            if not 0 < penetration <= 1:
+                raise ValueError(f"Expected penetration in (0, 1], got {penetration}")
+            cut_card = int(size * penetration)
+        if not 0 < cut_card <= size:
+            raise ValueError(f"Expected cut card position in [1, {size}], got {cut_card}")
+        self.cut = cut_card
+
+    @property
+    def penetration(self) -> float:
+        return self.cut / len(self.cards)
+
+    @property
+    def cut_reached(self) -> bool:
+        """cut card is out, reshuffle before the next round"""
+        return self.cursor >= self.cut
+
+    def reset(self):
+        """
+        Reshuffle, O(1): gather every card back and rewind the cursor.
+
+        The buffer is reshuffled in place as it's dealt, one swap per draw.
+        """
+        self.cursor = 0
+        self.epoch += 1
+        self._lazy = True
+        for observer in self.observers:
+            observer.on_reset()
+
+    shuffle = reset
+
+    def reshuffle_if_cut(self) -> bool:
+        """reset() if the cut card came out, call between rounds"""
+        if self.cursor >= self.cut:
+            self.reset()
+            return True
+        return False
+
+    def draw(self) -> int:
+        """next card code, O(1)"""
+        cursor = self.cursor
+        cards = self.cards
+        left = len(cards) - cursor
+        if left <= 0:
+            raise IndexError("draw from an empty shoe")
+        if self._lazy:
+            # one Fisher-Yates step: uniform pick among the cards left
+            # (random() * left instead of randrange(left), a call less per card)
+            pick = cursor + int(self.rng.random() * left)
+            code = cards[pick]
+            cards[pick] = cards[cursor]
+            cards[cursor] = code
+        else:
+            code = cards[cursor]
+        self.cursor = cursor + 1
+        if self.observers:
+            for observer in self.observers:
+                observer.on_draw(code)
+        return code
+
+    def put_back(self, code: int):
+        """
+        Return a dealt card to the shoe (e.g. an unseen hole card), O(dealt).
+        Any dealt card with the same code will do, they're interchangeable.
+        """
+        cards, last = self.cards, self.cursor - 1
+        for index in range(last, -1, -1):
+            if cards[index] == code:
+                break
+        else:
+            raise ValueError(f"Expected a dealt card, got {card_name(code)!r}")
+        cards[index] = cards[last]
+        cards[last] = code
+        self.cursor = last
+        for observer in self.observers:
+            observer.on_return(code)
+
+    def take(self, code: int) -> int:
+        """deal this exact card next, the inverse of put_back(), O(remaining)"""
+        cards, cursor = self.cards, self.cursor
+        for index in range(cursor, len(cards)):
+            if cards[index] == code:
+                break
+        else:
+            raise ValueError(f"Expected a card left in the shoe, got {card_name(code)!r}")
+        cards[index] = cards[cursor]
+        cards[cursor] = code
+        self.cursor = cursor + 1
+        for observer in self.observers:
+            observer.on_draw(code)
+        return code
+
+    def snapshot(self) -> tuple:
+        """O(1) state for restore(), valid until the next reset()"""
+        return (self.cursor, self._lazy, self.epoch)
+
+    def restore(self, snapshot: tuple):
+        """
+        Back to a snapshot(), O(1). Observers aren't told, restore their own
+        state alongside (see CountTracker.snapshot()).
+        """
+        cursor, lazy, epoch = snapshot
+        if epoch != self.epoch:
+            raise ValueError(f"Expected a snapshot from shoe epoch {self.epoch}, got {epoch} (reshuffled since)")
+        self.cursor = cursor
+        self._lazy = lazy
+
+    def add_observer(self, observer):
+        """observer.on_draw(code) after every draw, observer.on_reset() on reset()"""
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    def draw_name(self) -> str:
+        """next card as a client name"""
+        return CARD_NAMES[self.draw()]
+
+    def remaining(self) -> array:
+        """codes still in the shoe (copy, not in deal order while shuffled)"""
+        return self.cards[self.cursor:]
+
+    def __len__(self) -> int:
+        return len(self.cards) - self.cursor
+
+    def __repr__(self) -> str:
+        return f"Shoe(decks={self.decks}, remaining={len(self)}, cut={self.cut})"
@@ -0,0 +1,284 @@
+"""
+Vectorized Monte Carlo round simulator.
+
+Plays N independent rounds at once with NumPy arrays, same rules as
+BlackjackLogic.run_blackjack_console:
+    - deal order: players, dealer upcard, players, dealer hole card
+    - every round starts from a full shoe: rounds are independent, there is
+      no cut card or penetration (BlackjackLogic deals down to its cut card)
+    - a shoe that runs dry mid-round (many seats on 1 deck) is refilled with
+      a full one, where BlackjackLogic would raise
+    - players hit/stand/double down, a busted player loses right away
+    - dealer hits below 17 (soft 17 stands, it scores 17 in check_hand)
+    - higher total wins 1:1, ties push, dealer bust pays every standing player
+A blackjack_rules.Rules changes the shoe size, soft 17, which totals may
+double and the natural payout; its lookup tables are built once per rule set.
+
+Cards are drawn without replacement from per-round rank counts, so only the
+shoe composition is tracked, never a shuffled buffer.
+
+simulate_rounds() runs in-process, simulate() shards fixed-size blocks over a
+process pool with one spawned seed stream per block.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from blackjack_rng import FastRandom
+from blackjack_rules import Rules, compile_rules
+
+# value index 0 = ace, 1..8 = 2..9, 9 = ten-valued (10 J Q K)
+VALUE_COUNTS_PER_DECK = np.array([4, 4, 4, 4, 4, 4, 4, 4, 4, 16], dtype=np.int16)
+ACE = 0
+
+_rule_arrays = {} # Rules -> (dealer_hits, two-card double_ok, natural payout) as arrays
+
+# raw counters, summed as-is when merging chunks/workers
+COUNT_KEYS = ("rounds", "hands", "wins", "losses", "pushes",
+              "player_busts", "dealer_busts", "doubles", "net")
+
+
+def _totals(hard: np.ndarray, aces: np.ndarray) -> np.ndarray:
+    """check_hand rule: aces are 1, one ace goes to 11 if it fits"""
+    return hard + 10 * ((aces > 0) & (hard + 10 <= 21))
+
+
+def _arrays_for(rules: Rules) -> tuple:
+    """RuleTables as NumPy lookup arrays, built once per rule set"""
+    arrays = _rule_arrays.get(rules)
+    if arrays is None:
+        tables = compile_rules(rules)
+        pays = rules.blackjack_pays
+        arrays = _rule_arrays[rules] = (
+            np.array(tables.dealer_hits, dtype=bool),   # index (hard << 1) | has_ace
+            np.array(tables.double_ok[True], dtype=bool), # index two-card total
+            int(pays) if float(pays).is_integer() else pays,
+        )
+    return arrays
+
+
+def _draw(rng: np.random.Generator, counts: np.ndarray, full: np.ndarray,
+          rows: np.ndarray) -> np.ndarray:
+    """
+    draw one card per row (no replacement), returns value indices; a row
+    whose shoe is empty gets a full one first (see the module docstring)
+    """
+    cum = counts[rows].cumsum(axis=1)
+    empty = cum[:, -1] == 0
+    if empty.any():
+        counts[rows[empty]] = full
+        cum = counts[rows].cumsum(axis=1)
+    picks = rng.integers(0, cum[:, -1])
+    values = (cum <= picks[:, None]).sum(axis=1)
+    counts[rows, values] -= 1
+    return values
+
+
+def _add(hard: np.ndarray, aces: np.ndarray, rows: np.ndarray, values: np.ndarray, seat=None):
+    """add drawn cards to hands in place"""
+    index = rows if seat is None else (rows, seat)
+    hard[index] += values + 1
+    aces[index] += values == ACE
+
+
+def _simulate_chunk(rng, rounds, rules, seats, hit_below, double_on) -> dict:
+    dealer_hits, double_ok, natural_pays = _arrays_for(rules)
+    full = VALUE_COUNTS_PER_DECK * rules.decks
+    counts = np.tile(full, (rounds, 1))
+    draw = partial(_draw, rng, counts, full)
+    everyone = np.arange(rounds)
+
+    p_hard = np.zeros((rounds, seats), dtype=np.int16)
+    p_aces = np.zeros((rounds, seats), dtype=np.int16)
+    doubled = np.zeros((rounds, seats), dtype=bool)
+    d_hard = np.zeros(rounds, dtype=np.int16)
+    d_aces = np.zeros(rounds, dtype=np.int16)
+
+    # initial deal, order matters for the shoe composition
+    for seat in range(seats):
+        _add(p_hard, p_aces, everyone, draw(everyone), seat)
+    _add(d_hard, d_aces, everyone, draw(everyone))
+    for seat in range(seats):
+        _add(p_hard, p_aces, everyone, draw(everyone), seat)
+    hole = draw(everyone)
+    natural = _totals(p_hard, p_aces) == 21
+
+    # players turn, one seat after another
+    double_totals = np.array(sorted(double_on), dtype=np.int16)
+    for seat in range(seats):
+        rows = everyone
+        if double_totals.size:
+            totals = _totals(p_hard[:, seat], p_aces[:, seat])
+            dbl = np.isin(totals, double_totals) & double_ok[totals]
+            dbl_rows = everyone[dbl]
+            _add(p_hard, p_aces, dbl_rows, draw(dbl_rows), seat)
+            doubled[dbl_rows, seat] = True
+            rows = everyone[~dbl]
+
+        while rows.size:
+            rows = rows[_totals(p_hard[rows, seat], p_aces[rows, seat]) < hit_below]
+            if rows.size:
+                _add(p_hard, p_aces, rows, draw(rows), seat)
+
+    # dealers turn
+    _add(d_hard, d_aces, everyone, hole)
+    rows = everyone
+    while rows.size:
+        rows = rows[dealer_hits[(d_hard[rows] << 1) | (d_aces[rows] > 0)]]
+        if rows.size:
+            _add(d_hard, d_aces, rows, draw(rows))
+
+    # resolution
+    p_total = _totals(p_hard, p_aces)
+    d_total = _totals(d_hard, d_aces)[:, None]
+    p_bust = p_hard > 21
+    d_bust = (d_hard > 21)[:, None]
+
+    lose = p_bust | (~d_bust & (p_total < d_total))
+    win = ~p_bust & (d_bust | (p_total > d_total))
+    push = ~win & ~lose
+    stake = 1 + doubled.astype(np.int64)
+    paid = stake * np.where(natural & ~doubled, natural_pays, 1)
+
+    return {
+        "rounds": rounds,
+        "hands": rounds * seats,
+        "wins": int(win.sum()),
+        "losses": int(lose.sum()),
+        "pushes": int(push.sum()),
+        "player_busts": int(p_bust.sum()),
+        "dealer_busts": int(d_bust.sum()),
+        "doubles": int(doubled.sum()),
+        "net": ((paid * win).sum() - (stake * lose).sum()).item(),
+    }
+
+
+def merge_counts(*parts: dict) -> dict:
+    """sum raw counters from several runs, exact"""
+    merged = dict.fromkeys(COUNT_KEYS, 0)
+    for part in parts:
+        for key in COUNT_KEYS:
+            merged[key] += part[key]
+    return merged
+
+
+def summarize(counts: dict) -> dict:
+    """raw counters + per-hand rates and EV (per initial bet unit)"""
+    hands = counts["hands"] or 1
+    rounds = counts["rounds"] or 1
+    return {
+        **counts,
+        "ev": counts["net"] / hands,
+        "win_rate": counts["wins"] / hands,
+        "loss_rate": counts["losses"] / hands,
+        "push_rate": counts["pushes"] / hands,
+        "player_bust_rate": counts["player_busts"] / hands,
+        "dealer_bust_rate": counts["dealer_busts"] / rounds,
+        "double_rate": counts["doubles"] / hands,
+    }
+
+
+def _validate(decks: int, seats: int, hit_below: int):
+    if not 1 <= seats <= 7:
+        raise ValueError(f"Expected 1-7 seats, got {seats}")
+    if decks < 1:
+        raise ValueError(f"Expected at least 1 deck, got {decks}")
+    if not 2 <= hit_below <= 21:
+        raise ValueError(f"Expected hit_below in 2-21, got {hit_below}")
+
+
+def _simulate_counts(rng, rounds, rules, seats, hit_below, double_on, chunk_size) -> dict:
+    """raw counters for `rounds` rounds, played chunk by chunk"""
+    parts = []
+    left = rounds
+    while left > 0:
+        size = min(chunk_size, left)
+        parts.append(_simulate_chunk(rng, size, rules, seats, hit_below, tuple(double_on)))
+        left -= size
+    return merge_counts(*parts)
+
+
+def simulate_rounds(rounds: int, decks: int = 1, seats: int = 1,
+                    hit_below: int = 17, double_on=(10, 11),
+                    seed=None, rng: np.random.Generator | FastRandom | None = None,
+                    chunk_size: int = 250_000, rules: Rules | None = None) -> dict:
+    """
+    Simulate `rounds` independent rounds, return summarize()'d stats.
+
+    Args:
+        rounds: Number of rounds to play.
+        decks: Decks in the (fresh) shoe of every round.
+        seats: Players at the table, 1-7.
+        hit_below: Players hit while their total is below this.
+        double_on: Two-card totals the players double down on (if the rules allow it).
+        seed: Seed for a new PCG64 generator, ignored if rng is given.
+        rng: Generator (or FastRandom from blackjack_rng) to draw from.
+        chunk_size: Rounds per vectorized batch, bounds memory use.
+        rules: Table rules, Rules(decks=decks) by default; their decks win over `decks`.
+    """
+    rules = rules if rules is not None else Rules(decks=decks)
+    _validate(rules.decks, seats, hit_below)
+
+    if isinstance(rng, FastRandom):
+        rng = rng.generator
+    rng = rng if rng is not None else np.random.default_rng(seed)
+
+    return summarize(_simulate_counts(rng, rounds, rules, seats, hit_below, double_on, chunk_size))
+
+
+def _run_block(job: tuple) -> dict:
+    """worker entry point, one block with its own spawned seed stream"""
+    seed_seq, rounds, rules, seats, hit_below, double_on, chunk_size = job
+    rng = np.random.Generator(np.random.PCG64(seed_seq))
+    return _simulate_counts(rng, rounds, rules, seats, hit_below, double_on, chunk_size)
+
+
+def simulate(rounds: int, workers: int | None = None, decks: int = 1, seats: int = 1,
+             hit_below: int = 17, double_on=(10, 11), seed=None,
+             block_size: int = 1_000_000, chunk_size: int = 250_000, rules: Rules | None = None) -> dict:
+    """
+    Simulate across a process pool, reproducible for a given seed.
+
+    Work is cut into fixed `block_size` blocks, and block i always draws from
+    child i of SeedSequence(seed).spawn(). Workers only decide who plays which
+    block, so the merged (integer) counters are identical for any worker count.
+
+    Args:
+        rounds: Number of rounds to play.
+        workers: Processes to use, defaults to os.cpu_count(); 1 runs in-process.
+        seed: Root seed, None draws fresh entropy (returned as "seed").
+        block_size: Rounds per seed stream, part of the reproducibility key.
+        decks, seats, hit_below, double_on, chunk_size, rules: See simulate_rounds().
+    """
+    rules = rules if rules is not None else Rules(decks=decks)
+    _validate(rules.decks, seats, hit_below)
+
+    root = np.random.SeedSequence(seed)
+    sizes = [block_size] * (rounds // block_size)
+    if rounds % block_size:
+        sizes.append(rounds % block_size)
+    jobs = [(child, size, rules, seats, hit_below, tuple(double_on), chunk_size)
+            for child, size in zip(root.spawn(len(sizes)), sizes)]
+
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    if workers == 1:
+        parts = [_run_block(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_block, jobs))
+
+    return {**summarize(merge_counts(*parts)), "seed": root.entropy, "workers": workers}
+
+
+if __name__ == "__main__":
+    import time
+
+    for decks in (1, 8):
+        t0 = time.perf_counter()
+        stats = simulate(4_000_000, decks=decks, seed=0)
+        elapsed = time.perf_counter() - t0
+        print(f"{decks} deck(s): EV {stats['ev']:+.4f}  win {stats['win_rate']:.3f}  "
+              f"loss {stats['loss_rate']:.3f}  push {stats['push_rate']:.3f}  "
+              f"({stats['rounds'] / elapsed:,.0f} rounds/s)")
@@ -0,0 +1,183 @@
+"""
+Constant-memory streaming statistics for long sessions.
+
+RunningStats folds one result at a time into a fixed set of numbers:
+Welford mean / variance, the running total with its peak and trough (for
+max drawdown), min and max. Two accumulators merge exactly (Chan et al. for
+the moments; drawdown assuming `other` was played after `self`), so
+per-process results combine into the same numbers one process would get.
+
+StatsRecorder plugs into BlackjackLogic like the journal (`table.stats`):
+player_bust / player_win / player_lose and pushes call result(), and it
+keeps one RunningStats per seat (money) and per bet unit (results in units
+of the round's opening bet, doubles count 2).
+"""
+import math
+
+from blackjack_journal import WIN, PUSH
+
+
+class RunningStats:
+    """mean / variance / drawdown of a stream of per-round results"""
+    __slots__ = ("n", "mean", "m2", "total", "peak", "trough", "max_drawdown", "low", "high")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.total = 0.0
+        self.peak = 0.0   # highest running total, start included
+        self.trough = 0.0 # lowest running total, start included
+        self.max_drawdown = 0.0
+        self.low = math.inf
+        self.high = -math.inf
+
+    def add(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+        total = self.total = self.total + x
+        if total > self.peak:
+            self.peak = total
+        elif total < self.trough:
+            self.trough = total
+        if self.peak - total > self.max_drawdown:
+            self.max_drawdown = self.peak - total
+        if x < self.low:
+            self.low = x
+        if x > self.high:
+            self.high = x
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """fold `other` in, as if its results came after ours"""
+        if not other.n:
+            return self
+        if not self.n:
+            for name in self.__slots__:
+                setattr(self, name, getattr(other, name))
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+
+        # drawdown across the seam: our peak down to their lowest point
+        self.max_drawdown = max(self.max_drawdown, other.max_drawdown,
+                                self.peak - (self.total + other.trough))
+        self.peak = max(self.peak, self.total + other.peak)
+        self.trough = min(self.trough, self.total + other.trough)
+        self.total += other.total
+        self.low = min(self.low, other.low)
+        self.high = max(self.high, other.high)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """sample variance"""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        return self.stdev / math.sqrt(self.n) if self.n else math.inf
+
+    def confidence_interval(self, z: float = 1.96) -> tuple[float, float]:
+        """normal-approximation interval for the mean, 95% by default"""
+        half = z * self.stderr
+        return self.mean - half, self.mean + half
+
+    def risk_of_ruin(self, bankroll: float) -> float:
+        """
+        Chance of ever losing `bankroll` (same units as the results), diffusion
+        approximation exp(-2 * mean * bankroll / variance). 1.0 for a
+        non-positive edge.
+        """
+        if bankroll <= 0:
+            return 1.0
+        if self.mean <= 0:
+            return 1.0
+        variance = self.variance
+        if not variance:
+            return 0.0
+        return min(1.0, math.exp(-2.0 * self.mean * bankroll / variance))
+
+    def snapshot(self) -> dict:
+        """plain numbers, for JSON or sending to another process"""
+        snap = {name: getattr(self, name) for name in self.__slots__}
+        snap.update(variance=self.variance, stdev=self.stdev, ci95=self.confidence_interval())
+        return snap
+
+    @classmethod
+    def from_snapshot(cls, snap: dict) -> "RunningStats":
+        stats = cls()
+        for name in cls.__slots__:
+            setattr(stats, name, snap[name])
+        return stats
+
+    def __repr__(self) -> str:
+        return (f"RunningStats(n={self.n}, mean={self.mean:.6g}, stdev={self.stdev:.6g}, "
+                f"max_drawdown={self.max_drawdown:.6g})")
+
+
+class StatsRecorder:
+    """
+    BlackjackLogic hook (`table.stats`), same calls as RoundRecorder.
+
+    Seats are keyed by name. Outside begin_round() / end_round() (the Ursina
+    flow) the bet at settlement is used as the unit.
+    """
+    def __init__(self):
+        self.seats = {}  # seat name -> RunningStats of money won / lost per round
+        self.units = {}  # opening bet -> RunningStats of result in bet units
+        self.rounds = 0
+        self._bets = {}
+
+    def begin_round(self, players: list, dealer=None):
+        self._bets = {id(player): player.bet for player in players}
+
+    def result(self, seat, outcome: int, amount: float):
+        net = amount if outcome == WIN else 0.0 if outcome == PUSH else -amount
+        stats = self.seats.get(seat.name)
+        if stats is None:
+            stats = self.seats[seat.name] = RunningStats()
+        stats.add(net)
+
+        unit = self._bets.get(id(seat)) or amount
+        if unit:
+            stats = self.units.get(unit)
+            if stats is None:
+                stats = self.units[unit] = RunningStats()
+            stats.add(net / unit)
+
+    def end_round(self):
+        self._bets = {}
+        self.rounds += 1
+
+    def merge(self, other: "StatsRecorder") -> "StatsRecorder":
+        for mine, theirs in ((self.seats, other.seats), (self.units, other.units)):
+            for key, stats in theirs.items():
+                mine.setdefault(key, RunningStats()).merge(stats)
+        self.rounds += other.rounds
+        return self
+
+    def snapshot(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "seats": {name: stats.snapshot() for name, stats in self.seats.items()},
+            "units": {unit: stats.snapshot() for unit, stats in self.units.items()},
+        }
+
+    @classmethod
+    def from_snapshot(cls, snap: dict) -> "StatsRecorder":
+        recorder = cls()
+        recorder.rounds = snap["rounds"]
+        recorder.seats = {name: RunningStats.from_snapshot(s) for name, s in snap["seats"].items()}
+        recorder.units = {float(unit): RunningStats.from_snapshot(s) for unit, s in snap["units"].items()}
+        return recorder
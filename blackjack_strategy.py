@@ -0,0 +1,248 @@
+"""
+Exact basic-strategy solver.
+
+Expected value of Stand / Hit / Double Down for every (player total, soft
+flag, dealer upcard), computed by memoized recursion over the shoe
+composition. Rules are the ones BlackjackLogic plays:
+    - no hole-card peek, a natural 21 is just 21 and pays 1:1
+    - dealer hits below 17, soft 17 stands
+    - double down is allowed on any hand (run_action_player doesn't check the
+      card count): double the bet, one card, stand
+    - ties push
+
+Shoes are tuples of 10 counts indexed by value: 0 = ace, 1..8 = 2..9, 9 = ten
+(10 J Q K). A hand is (hard, ace) - hard total with aces as 1, and whether it
+holds an ace. EVs are per initial bet unit.
+
+A blackjack_rules.Rules swaps in H17, double restrictions and the natural
+payout; strategy_table_for() keeps one finished table per rule set.
+"""
+from blackjack_dealer import DealerOutcomes, DEALER_TOTALS, hand_total
+from blackjack_rules import Rules, compile_rules
+from blackjack_shoe import ACE_RANK, CARD_CODES, Shoe, card_rank
+
+VALUE_NAMES = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10')
+ACTIONS = ("stand", "hit", "double")
+
+# one deck by value index
+DECK_COUNTS = (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+
+# rank index (blackjack_shoe) -> value index
+RANK_TO_VALUE = tuple(0 if rank == ACE_RANK else min(rank + 1, 9) for rank in range(13))
+
+
+def shoe_counts(decks: int = 1) -> tuple:
+    """full shoe by value index"""
+    return tuple(count * decks for count in DECK_COUNTS)
+
+
+def card_value(card: str | int) -> int:
+    """value index of a card code or client name ("QH" -> 9)"""
+    code = CARD_CODES[card] if isinstance(card, str) else card
+    return RANK_TO_VALUE[card_rank(code)]
+
+
+def shoe_composition(deck: Shoe | list) -> tuple:
+    """value counts of what's left in a live deck (BlackjackLogic.deck or a list of names)"""
+    counts = [0] * 10
+    codes = deck.remaining() if isinstance(deck, Shoe) else (CARD_CODES[name] for name in deck)
+    for code in codes:
+        counts[RANK_TO_VALUE[card_rank(code)]] += 1
+    return tuple(counts)
+
+
+def remove_cards(shoe: tuple, values) -> tuple:
+    """shoe without the given value indices"""
+    counts = list(shoe)
+    for value in values:
+        if counts[value] <= 0:
+            raise ValueError(f"No {VALUE_NAMES[value]} left in shoe {shoe}")
+        counts[value] -= 1
+    return tuple(counts)
+
+
+class StrategySolver:
+    """
+    Memoized EV solver for one shoe size.
+
+    Memo tables live on the instance, so one solver reused for a whole
+    strategy table shares every sub-result (dealer outcomes and player
+    continuations) between rows. Pass a shared DealerOutcomes to reuse dealer
+    results across solvers.
+    """
+    def __init__(self, decks: int = 1, double_any_time: bool = True,
+                 dealer: DealerOutcomes | None = None, rules: Rules | None = None):
+        # rules win over decks / double_any_time, they're kept for old callers
+        self.rules = rules if rules is not None else Rules(decks=decks, double_after_hit=double_any_time)
+        self.decks = self.rules.decks
+        self.double_any_time = self.rules.double_after_hit
+        self.full_shoe = shoe_counts(self.decks)
+        self.dealer = dealer if dealer is not None else DealerOutcomes(rules=self.rules)
+        if self.dealer.rules.hit_soft_17 != self.rules.hit_soft_17:
+            raise ValueError(f"Expected a dealer engine with hit_soft_17={self.rules.hit_soft_17}, "
+                             f"got {self.dealer.rules.hit_soft_17}")
+        self._double_ok = compile_rules(self.rules).double_ok
+        self._best_memo = {}
+
+    # ---- dealer -----------------------------------------------------------
+    def dealer_outcomes(self, up: int, shoe: tuple) -> tuple:
+        """P(dealer ends on 17, 18, 19, 20, 21, bust) for upcard value `up`, hole card still in `shoe`"""
+        return self.dealer.outcomes(up, shoe)
+
+    # ---- player -----------------------------------------------------------
+    def stand_ev(self, hard: int, ace: bool, up: int, shoe: tuple) -> float:
+        if hard > 21:
+            return -1.0
+        total = hand_total(hard, ace)
+        probs = self.dealer_outcomes(up, shoe)
+        ev = probs[5] # dealer bust
+        for i, dealer_total in enumerate(DEALER_TOTALS):
+            if total > dealer_total:
+                ev += probs[i]
+            elif total < dealer_total:
+                ev -= probs[i]
+        return ev
+
+    def hit_ev(self, hard: int, ace: bool, up: int, shoe: tuple) -> float:
+        """take one card, then keep playing optimally"""
+        return self._draw_one(hard, ace, up, shoe, self._best_ev)
+
+    def double_ev(self, hard: int, ace: bool, up: int, shoe: tuple) -> float:
+        """double the bet, take one card, stand"""
+        return 2.0 * self._draw_one(hard, ace, up, shoe, self.stand_ev)
+
+    def _draw_one(self, hard, ace, up, shoe, then) -> float:
+        left = sum(shoe)
+        ev = 0.0
+        for value, count in enumerate(shoe):
+            if not count:
+                continue
+            new_hard = hard + value + 1
+            if new_hard > 21:
+                ev -= count / left
+                continue
+            ev += count / left * then(new_hard, ace or value == 0, up,
+                                      shoe[:value] + (count - 1,) + shoe[value + 1:])
+        return ev
+
+    def _best_ev(self, hard: int, ace: bool, up: int, shoe: tuple) -> float:
+        """value of a hand after at least one hit"""
+        key = (hard, ace, up, shoe)
+        cached = self._best_memo.get(key)
+        if cached is not None:
+            return cached
+
+        best = self.stand_ev(hard, ace, up, shoe)
+        total = hand_total(hard, ace)
+        if total < 21:
+            best = max(best, self.hit_ev(hard, ace, up, shoe))
+            if self._double_ok[False][total]: # after a hit, per the rules
+                best = max(best, self.double_ev(hard, ace, up, shoe))
+
+        self._best_memo[key] = best
+        return best
+
+    def action_evs(self, hard: int, ace: bool, up: int, shoe: tuple) -> dict:
+        """EV of every action for one exact hand against one exact shoe, allowed or not"""
+        return {
+            "stand": self.stand_ev(hard, ace, up, shoe),
+            "hit": self.hit_ev(hard, ace, up, shoe),
+            "double": self.double_ev(hard, ace, up, shoe),
+        }
+
+    # ---- tables -----------------------------------------------------------
+    def two_card_hands(self, total: int, soft: bool) -> list[tuple[int, int]]:
+        """value index pairs (low, high) dealt as `total`, soft or hard"""
+        pairs = []
+        for a in range(10):
+            for b in range(a, 10):
+                hard = a + b + 2
+                ace = a == 0 or b == 0
+                if hand_total(hard, ace) == total and (ace and hard + 10 <= 21) == soft:
+                    pairs.append((a, b))
+        return pairs
+
+    def row_evs(self, total: int, soft: bool, up: int) -> dict | None:
+        """
+        Action EVs for a (total, soft, upcard) row, averaged over every two-card
+        hand making that total, weighted by how likely it is to be dealt.
+        """
+        base = remove_cards(self.full_shoe, (up,))
+        acc = dict.fromkeys(ACTIONS, 0.0)
+        weight_sum = 0.0
+        for a, b in self.two_card_hands(total, soft):
+            weight = base[a] * (base[b] - (a == b)) * (1 if a == b else 2)
+            if weight <= 0:
+                continue
+            shoe = remove_cards(base, (a, b))
+            evs = self.action_evs(a + b + 2, a == 0 or b == 0, up, shoe)
+            for action in ACTIONS:
+                acc[action] += weight * evs[action]
+            weight_sum += weight
+
+        if not weight_sum:
+            return None
+        evs = {action: ev / weight_sum for action, ev in acc.items()}
+        if total == 21 and soft: # every two-card soft 21 is a natural
+            evs["stand"] *= self.rules.blackjack_pays
+        if not self._double_ok[True][total]:
+            del evs["double"]
+        return evs
+
+    def strategy_table(self) -> dict:
+        """
+        Full two-card strategy table.
+
+        Returns:
+            {(total, soft, upcard): {"evs": {action: ev}, "best": action}}
+            with upcard as a value index (0 = ace ... 9 = ten).
+        """
+        rows = [(total, False) for total in range(4, 21)]
+        rows += [(total, True) for total in range(12, 22)]
+
+        table = {}
+        for total, soft in rows:
+            for up in range(10):
+                evs = self.row_evs(total, soft, up)
+                if evs is None:
+                    continue
+                table[(total, soft, up)] = {"evs": evs, "best": max(evs, key=evs.get)}
+        return table
+
+
+_tables = {} # Rules -> strategy_table()
+
+
+def strategy_table_for(rules: Rules | None = None) -> dict:
+    """StrategySolver(rules=rules).strategy_table(), solved once per rule set"""
+    # the cut card doesn't change a single hand's EVs, one table for every penetration
+    rules = (rules if rules is not None else Rules())._replace(penetration=Rules().penetration)
+    table = _tables.get(rules)
+    if table is None:
+        table = _tables[rules] = StrategySolver(rules=rules).strategy_table()
+    return table
+
+
+def format_table(table: dict) -> str:
+    """printable chart, S / H / D per upcard"""
+    letters = {"stand": 'S', "hit": 'H', "double": 'D'}
+    lines = ["        " + " ".join(f"{name:>2}" for name in VALUE_NAMES[1:] + VALUE_NAMES[:1])]
+    order = (1, 2, 3, 4, 5, 6, 7, 8, 9, 0) # 2..10 then ace, like printed charts
+    for soft in (False, True):
+        totals = sorted({total for total, is_soft, _ in table if is_soft == soft})
+        for total in totals:
+            label = f"{'soft' if soft else 'hard'} {total:>2}"
+            cells = [letters[table[(total, soft, up)]["best"]] if (total, soft, up) in table else '-'
+                     for up in order]
+            lines.append(f"{label} " + " ".join(f"{cell:>2}" for cell in cells))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    solver = StrategySolver(decks=1)
+    table = solver.strategy_table()
+    print(format_table(table))
+    print(f"\nbuilt in {time.perf_counter() - t0:.2f}s")
@@ -0,0 +1,142 @@
+"""
+On-disk cache of solved tables.
+
+A strategy table takes seconds to solve per rule set, so solved tables
+(strategy EVs, dealer outcome odds) are saved once as .npy files and
+memory-mapped read-only afterwards: every worker or client on the machine
+maps the same file and shares its pages.
+
+Files are named <table>-<Rules.key()>-<engine>.npy, where <engine> is a
+hash of ENGINE_VERSION and the source of the solver modules. A change to
+the rules or the code gives a new name, old files are simply never read
+again (prune() deletes them). Writes go to a temp file that is renamed
+into place, so readers never see half a table. If the cache directory
+can't be written the table is solved in memory instead.
+
+Cache directory: $BLACKJACK_CACHE_DIR, else $XDG_CACHE_HOME/blackjack, else
+~/.cache/blackjack.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+import blackjack_dealer
+import blackjack_rules
+import blackjack_strategy
+from blackjack_dealer import DealerOutcomes
+from blackjack_rules import Rules
+from blackjack_strategy import ACTIONS, StrategySolver, remove_cards, shoe_counts
+
+ENGINE_VERSION = 1 # bump on changes the source hash can't see (numpy layout, file format)
+ENGINE_MODULES = (blackjack_dealer, blackjack_rules, blackjack_strategy)
+
+# strategy array layout: [soft][total][upcard][action], NaN = no such row / action not allowed
+STRATEGY_SHAPE = (2, 22, 10, len(ACTIONS))
+
+_fingerprint = None
+
+
+def cache_dir() -> Path:
+    root = os.environ.get("BLACKJACK_CACHE_DIR")
+    if root:
+        return Path(root)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "blackjack"
+
+
+def engine_fingerprint() -> str:
+    """hash of ENGINE_VERSION and the solver sources, read once per process"""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(f"engine {ENGINE_VERSION}\n".encode())
+        for module in ENGINE_MODULES:
+            digest.update(Path(module.__file__).read_bytes())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+def table_path(name: str, rules: Rules, directory: Path | None = None) -> Path:
+    """cache file for table `name` under `rules`"""
+    return (directory or cache_dir()) / f"{name}-{rules.key()}-{engine_fingerprint()[:16]}.npy"
+
+
+def _table_rules(rules: Rules | None) -> Rules:
+    # same normalization as strategy_table_for, penetration doesn't change a hand's EVs
+    return (rules if rules is not None else Rules())._replace(penetration=Rules().penetration)
+
+
+# ---- builders ---------------------------------------------------------------
+def build_strategy_array(rules: Rules) -> np.ndarray:
+    """StrategySolver(rules=rules).strategy_table() as a STRATEGY_SHAPE array"""
+    array = np.full(STRATEGY_SHAPE, np.nan)
+    for (total, soft, up), row in StrategySolver(rules=rules).strategy_table().items():
+        for index, action in enumerate(ACTIONS):
+            if action in row["evs"]:
+                array[int(soft), total, up, index] = row["evs"][action]
+    return array
+
+
+def build_dealer_array(rules: Rules) -> np.ndarray:
+    """(10, 6) P(17, 18, 19, 20, 21, bust) per upcard off a full shoe, hole card unseen"""
+    dealer = DealerOutcomes(rules=rules)
+    full = shoe_counts(rules.decks)
+    return np.array([dealer.outcomes(up, remove_cards(full, (up,))) for up in range(10)])
+
+
+TABLES = {
+    "strategy": (build_strategy_array, _table_rules),
+    "dealer": (build_dealer_array, _table_rules),
+}
+
+
+# ---- cache ------------------------------------------------------------------
+def load_table(name: str, rules: Rules | None = None, directory: Path | None = None,
+               mmap: bool = True) -> np.ndarray:
+    """
+    Table `name` ("strategy" / "dealer") for `rules`, solved and saved on
+    the first call for that rule set and engine, memory-mapped read-only after.
+    """
+    if name not in TABLES:
+        raise ValueError(f"Expected a table in {tuple(TABLES)}, got {name!r}")
+    build, normalize = TABLES[name]
+    rules = normalize(rules)
+    path = table_path(name, rules, directory)
+    if not path.exists():
+        table = build(rules)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(temp, "wb") as f:
+                np.save(f, table)
+            os.replace(temp, path) # atomic, concurrent builders just overwrite with the same bytes
+        except OSError:
+            table.flags.writeable = False # same contract as the mapped file
+            return table
+    return np.load(path, mmap_mode="r" if mmap else None)
+
+
+def strategy_table(rules: Rules | None = None, directory: Path | None = None) -> dict:
+    """strategy_table_for(rules) backed by the disk cache, same dict format"""
+    evs = load_table("strategy", rules, directory)
+    table = {}
+    for soft, total, up in zip(*np.nonzero(~np.isnan(evs[..., 0]))):
+        row = {action: float(evs[soft, total, up, index])
+               for index, action in enumerate(ACTIONS) if not np.isnan(evs[soft, total, up, index])}
+        table[(int(total), bool(soft), int(up))] = {"evs": row, "best": max(row, key=row.get)}
+    return table
+
+
+def prune(directory: Path | None = None) -> int:
+    """delete cache files written by other engine versions, returns how many"""
+    directory = directory or cache_dir()
+    if not directory.is_dir():
+        return 0
+    current = engine_fingerprint()[:16]
+    removed = 0
+    for path in directory.glob("*.npy"):
+        if path.stem.rsplit("-", 1)[-1] != current:
+            path.unlink()
+            removed += 1
+    return removed
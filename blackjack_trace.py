@@ -0,0 +1,194 @@
+"""
+Structured event tracing for BlackjackLogic.
+
+Replaces the DEBUG prints in the round loop. Call sites check one bool flag
+per category before building anything, so a disabled category costs an
+attribute lookup and nothing else. Enabled events go into a preallocated ring
+buffer and only reach the sinks (stdout, text file, binary file) on flush(),
+which the callers do at round / prompt / frame boundaries, off the hot path.
+
+Event fields: (category, time_ns, name, score, amount, payload)
+    deal    payload = card                  (hit)
+    action  payload = action name           (run_action_player)
+    turn    payload = tuple of cards        (process_turn)
+    bust    amount = bet lost, payload = cards
+    win     amount = bet won, payload = cards
+    lose    amount = bet lost
+    reset   payload = "player" / "dealer"
+"""
+import struct
+import sys
+import time
+
+CATEGORIES = ("deal", "action", "turn", "bust", "win", "lose", "reset")
+CATEGORY_CODES = {name: code for code, name in enumerate(CATEGORIES)}
+
+# what the old DEBUG = True printed by default (hit only printed with debug=True)
+DEFAULT_CATEGORIES = ("action", "turn", "bust", "win", "lose", "reset")
+
+
+class Tracer:
+    """
+    Per-category flags + ring buffer of typed events.
+
+    Flags are plain attributes named after the categories (tracer.bust, ...)
+    so call sites can guard with `if tracer.bust:`.
+    """
+    def __init__(self, categories=(), sinks=(), size: int = 4096):
+        for name in CATEGORIES:
+            setattr(self, name, False)
+        self.enable(*categories)
+        self.sinks = list(sinks)
+        self.size = size
+
+        # preallocated ring, one slot list per field
+        self._category = [0] * size
+        self._time = [0] * size
+        self._name = [None] * size
+        self._score = [0] * size
+        self._amount = [0.0] * size
+        self._payload = [None] * size
+        self._head = 0  # next slot to write
+        self._count = 0 # pending events
+
+    def enable(self, *categories):
+        for name in categories:
+            if name not in CATEGORY_CODES:
+                raise ValueError(f"Unknown trace category {name!r}, expected one of {CATEGORIES}")
+            setattr(self, name, True)
+
+    def disable(self, *categories):
+        for name in categories or CATEGORIES:
+            if name not in CATEGORY_CODES:
+                raise ValueError(f"Unknown trace category {name!r}, expected one of {CATEGORIES}")
+            setattr(self, name, False)
+
+    def emit(self, category: str, name, score=0, amount=0.0, payload=None):
+        """store one event, flushes to the sinks only when the ring is full"""
+        if self._count == self.size:
+            self.flush()
+        i = self._head
+        self._category[i] = CATEGORY_CODES[category]
+        self._time[i] = time.perf_counter_ns()
+        self._name[i] = name
+        self._score[i] = score
+        self._amount[i] = amount
+        self._payload[i] = payload
+        self._head = (i + 1) % self.size
+        self._count += 1
+
+    def events(self) -> list[tuple]:
+        """pending events, oldest first"""
+        start = (self._head - self._count) % self.size
+        out = []
+        for k in range(self._count):
+            i = (start + k) % self.size
+            out.append((CATEGORIES[self._category[i]], self._time[i], self._name[i],
+                        self._score[i], self._amount[i], self._payload[i]))
+        return out
+
+    def flush(self):
+        """hand pending events to every sink and empty the ring"""
+        if not self._count:
+            return
+        events = self.events()
+        start, size = self._head - self._count, self.size
+        for k in range(self._count): # drop references, drained slots only
+            i = (start + k) % size
+            self._name[i] = self._payload[i] = None
+        self._count = 0
+        for sink in self.sinks:
+            sink.write(events)
+
+    def close(self):
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+
+def format_event(event: tuple) -> str:
+    """same text the old DEBUG prints produced"""
+    category, _, name, score, amount, payload = event
+    if category == "deal":
+        return f"You hit {payload}"
+    if category == "action":
+        return {"hit": "Hit!", "stand": "Stand!", "double_down": "Double Down!"}.get(payload, payload)
+    if category == "turn":
+        return f"\nPlayer {name} score: {score}\n{list(payload)}"
+    if category == "bust":
+        return f"Player {name} busted with score {score}, losing {amount}$\n{list(payload)}"
+    if category == "win":
+        return f"Player {name} won with score {score}, winning {amount}$\n{list(payload)}"
+    if category == "lose":
+        return f"Player {name} lost with score {score},  losing {amount}$"
+    if category == "reset":
+        return f"{payload.capitalize()} {name} reset"
+    return repr(event)
+
+
+class StdoutSink:
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write(self, events: list[tuple]):
+        stream = self.stream or sys.stdout # resolved late, plays well with redirect_stdout
+        stream.write("".join(format_event(event) + "\n" for event in events))
+
+    def close(self):
+        pass
+
+
+class FileSink:
+    """text lines, timestamped"""
+    def __init__(self, path):
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, events: list[tuple]):
+        self._file.write("".join(f"{event[1]} {event[0]} {format_event(event).strip()!r}\n"
+                                 for event in events))
+
+    def close(self):
+        self._file.close()
+
+
+class BinarySink:
+    """
+    fixed header per event + length-prefixed utf-8 name / payload:
+        <B category> <q time_ns> <h score> <d amount> <H name len> <H payload len>
+    """
+    HEADER = struct.Struct("<BqhdHH")
+
+    def __init__(self, path):
+        self._file = open(path, "ab")
+
+    def write(self, events: list[tuple]):
+        chunks = []
+        for category, t, name, score, amount, payload in events:
+            name_b = str(name).encode()
+            payload_b = b"" if payload is None else str(payload).encode()
+            chunks.append(self.HEADER.pack(CATEGORY_CODES[category], t, score or 0,
+                                           float(amount or 0), len(name_b), len(payload_b)))
+            chunks.append(name_b)
+            chunks.append(payload_b)
+        self._file.write(b"".join(chunks))
+
+    def close(self):
+        self._file.close()
+
+
+def read_binary(path) -> list[tuple]:
+    """events back from a BinarySink file (payloads as strings)"""
+    header = BinarySink.HEADER
+    with open(path, "rb") as f:
+        data = f.read()
+    events = []
+    pos = 0
+    while pos < len(data):
+        code, t, score, amount, name_len, payload_len = header.unpack_from(data, pos)
+        pos += header.size
+        name = data[pos:pos + name_len].decode()
+        pos += name_len
+        payload = data[pos:pos + payload_len].decode() if payload_len else None
+        pos += payload_len
+        events.append((CATEGORIES[code], t, name, score, amount, payload))
+    return events
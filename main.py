@@ -20,7 +20,9 @@ from painting_on_water.camera_manager import CameraMan
 from painting_on_water.blender_cam import BlenderCamera
 from painting_on_water.simple_scheduler import ScheduleSeq
 from painting_on_water import resource_path_rel
-import os, math, random, json, copy
+from blackjack_rng import get_rng
+from blackjack_shoe import Shoe, card_code
+import os, math, json, copy
 
 PATH_C = resource_path_rel("Assets/Cards/")
 PATH_T = resource_path_rel("Assets/Table/")
@@ -73,8 +75,6 @@ os.chdir(RUNTIME_ROOT)  # <-- makes open('Assets/...') work
 with open(Path(PATH_D + "card_positions_4_test.json"), 'r') as f:
     table_card_slots = json.load(f)
 
-sys_rand = random.SystemRandom()
-
 app = Ursina(development_mode=False, borderless=False, fullscreen=False)
 
 outline_camera_prep() # outline + camera settings
@@ -92,7 +92,8 @@ lut_table = LTable(step=0.01, radians=True)
 # }
 
 def preload_deck(folder=Path(PATH_C) / "card_pack",
-                 center=Vec3(0,0,0)):
+                 center=Vec3(0,0,0), rng=None):
+    rng = rng if rng is not None else get_rng()
     textures = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(".png")]
     textures.sort()
     cards = []
@@ -105,7 +106,7 @@ def preload_deck(folder=Path(PATH_C) / "card_pack",
         card.scale=0
         cards.append(card)
         
-    sys_rand.shuffle(cards)
+    rng.shuffle(cards)
     return cards
 
 def value_check(v):
@@ -119,8 +120,9 @@ class TornadoController(Entity):
                  radius_x=2.0, radius_y=3.0, radius_z=2.0,
                  turns=12, duration=1.2, delay=0.02,
                  card_height=1000/1050, card_length=1000/750,
-                 debug=DEBUG):
+                 debug=DEBUG, rng=None):
         super().__init__(position=center)
+        self.rng = rng if rng is not None else get_rng()
         self.cards = []
         self.active = False
         self.radius_x = radius_x
@@ -147,12 +149,12 @@ class TornadoController(Entity):
             
             # uniform z in [-1,1], jittered
             z = 1 - 2 * t
-            z += random.uniform(-jitter_strength, jitter_strength) / total
+            z += self.rng.uniform(-jitter_strength, jitter_strength) / total
             z = max(-1, min(1, z))  # clamp
 
             phi = lut_table.acos_lut(z)
             value_check(phi)
-            theta = i * golden_angle + random.uniform(-jitter_strength, jitter_strength)
+            theta = i * golden_angle + self.rng.uniform(-jitter_strength, jitter_strength)
 
             # Cartesian coords, scaled by sphere_radius
             x = lut_table.sin_lut(phi) * lut_table.cos_lut(theta) * sphere_radius * self.radius_x
@@ -168,9 +170,9 @@ class TornadoController(Entity):
 
             target.parent = self
             target.scale = Vec3(CARD_HEIGHT, CARD_LENGTH, 0.1)
-            target.rotation = Vec3(random.uniform(-15, 15),
-                                   random.uniform(0, 360),
-                                   random.uniform(-15, 15))
+            target.rotation = Vec3(self.rng.uniform(-15, 15),
+                                   self.rng.uniform(0, 360),
+                                   self.rng.uniform(-15, 15))
             
             target.name = card.custom_class_param["name"]
             target.hide(BIT)
@@ -241,14 +243,12 @@ def set_deck(new_cards):
     deck = new_cards
     # print(deck)
 
-def reset_ref_deck(ref_deck):
-    ref_deck.clear()
-    for card in deck:
-        ref_deck.append(card.custom_class_param["name"])
-
-def get_cards(ref_deck):
-    for card in deck:
-        ref_deck.append(card.custom_class_param["name"])
+def get_cards(blackjack_table):
+    """logic shoe over the scene's cards, reset in place every round after this"""
+    codes = [card_code(card.custom_class_param["name"]) for card in deck]
+    blackjack_table.deck = Shoe.from_codes(codes, rng=blackjack_table.rng, shuffled=True)
+    blackjack_table.attach_counter()
+    return blackjack_table.deck
 
 def get_card(card_name):
     for card in deck:
@@ -423,7 +423,7 @@ class GameBlackjack():
         # game logic stuff
         self.game_ticker = ScheduleSeq()
         self.blackjack_table = BlackjackLogic()
-        self.ref_deck = []
+        self.ref_deck = [] # Shoe over the scene cards once loaded, see load_shoe()
         self.game_running = False
         self.player = None
         self.resolution = "None"
@@ -473,7 +473,7 @@ class GameBlackjack():
 
         self.game_ticker.add_action(do_nothing, 0.02 * 52 + 1.2) # DO NOT CHANGE DELAY, KEEP HARD CODED
 
-        self.game_ticker.add_action(lambda: get_cards(self.ref_deck))
+        self.game_ticker.add_action(self.load_shoe)
         self.game_ticker.add_action(lambda: print("game_ready"))
 
         # main round logic
@@ -509,6 +509,9 @@ class GameBlackjack():
         self.game_ticker.add_action(do_nothing, 0.1)
         self.game_ticker.add_action(self.assign_buttons)
 
+    def load_shoe(self):
+        self.ref_deck = get_cards(self.blackjack_table)
+
     def disable_buttons(self):
         btn_hit.ignore_input = True # TODO: wrap the scheduler/invoke for these with disables/enables instead
         btn_stand.ignore_input = True
@@ -540,7 +543,7 @@ class GameBlackjack():
             self.game_ticker.add_action(self.dealer_hit_loop)
 
     def the_check(self):
-        if self.dealer["score"] < 17: # type: ignore
+        if self.blackjack_table.dealer_hits(self.dealer): # stands on 17 unless the rules hit soft 17
             self.game_ticker.add_action(self.dealer_hit_loop)
             self.game_ticker.add_action(lambda: print("DEALER:", self.dealer))
         else:
@@ -563,7 +566,6 @@ class GameBlackjack():
         else:
             self.resolution = "tied"
 
-        self.game_ticker.add_action(self.blackjack_table.refresh_deck)
         self.game_ticker.add_action(self.reset_round)
 
     def new_round(self):
@@ -572,7 +574,8 @@ class GameBlackjack():
         update_player_score(0)
         update_dealer_score(0)
 
-        self.game_ticker.add_action(lambda: reset_ref_deck(self.ref_deck))
+        # every card goes back to the shoe, O(1) reset of the same buffer, busted rounds included
+        self.game_ticker.add_action(self.ref_deck.reset)
         self.game_ticker.add_action(lambda: print("round_ready"))
 
         self.player = self.blackjack_table.players[0]
@@ -615,6 +618,7 @@ class GameBlackjack():
             self.game_ticker.add_action(lambda: camera_man.load_cam_anim('2'), 1)
 
     def listen_to_logic(self):
+        """bust check, runs right after each player hit (see do_hit) instead of every frame"""
         if self.player:
             if self.player["busted"] and not self.reset_round_trg:
                 self.game_ticker.add_action(lambda: print("Busted"))
@@ -686,6 +690,7 @@ def do_hit(game_ticker, blackjack_table, player, ref_deck, slots, update_score=T
     # run logic
     game_ticker.add_action(lambda: blackjack_table.hit(player, ref_deck, 1, True))
     game_ticker.add_action(lambda: blackjack_table.process_turn(player))
+    game_ticker.add_action(blackjack_game.listen_to_logic)
     game_ticker.add_action(lambda: animate_hit(player, slots[slot], player_slots_cards), duration=0.4)
 
     # update text
@@ -753,12 +758,13 @@ def update():
     if not blackjack_game.game_running:
         new_card.rotation_y += 0.1
         new_card.rotation_x += 0.2
-    else:
-        blackjack_game.listen_to_logic()
 
     if blackjack_game.game_ticker:
         blackjack_game.game_ticker.update()
 
+    # buffered logic trace, printed once per frame
+    blackjack_game.blackjack_table.tracer.flush()
+
 set_deck(preload_deck())
 
 # print("MSAA samples in main window:", base.win.getFbProperties().getMultisamples())
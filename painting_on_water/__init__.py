@@ -1,33 +1,39 @@
 # pwat | powat | paintwater | pwt | powt
- 
-from .helpers_r import vinput, is_valid_e164
-from .date_helpers import DateHelper
-from .revindex_utils import ReverseIndex
-from .crypto_utils import (
-    ensure_secret_key, get_secret_key,
-    hmac_sha256_hex, verify_hmac_sha256_hex,
-    hmac_sha256_bytes, verify_hmac_sha256_bytes,
-    hmac_hex, verify_hmac_hex,
-    hmac_bytes, verify_hmac_bytes,
-)
-from .ursina_helpers import resource_path_rel
-from .camera_outline import outline_camera_prep
-from .blender_cam import BlenderCamera
-from .animators import TransformAnimator, OneValueAnimator
-from .camera_manager import CameraMan, EditorCamFix
-from .card import Card
-from .gentity import GEntity
-from .lut_tables_2 import LTable
-from .scene_manager import SceneManager
-from .simple_scheduler import ScheduleSeq
-from .ui import SceneUI
+
+# lazy attribute loading (PEP 562): submodules are only imported on first access,
+# so headless users (blackjack_logic, sim workers, CLI) never pull in ursina/panda3d
+import importlib
+
+_LAZY_ATTRS = {
+    "vinput": ".helpers_r",
+    "is_valid_e164": ".helpers_r",
+    "DateHelper": ".date_helpers",
+    "ReverseIndex": ".revindex_utils",
+    "ensure_secret_key": ".crypto_utils", "get_secret_key": ".crypto_utils",
+    "hmac_sha256_hex": ".crypto_utils", "verify_hmac_sha256_hex": ".crypto_utils",
+    "hmac_sha256_bytes": ".crypto_utils", "verify_hmac_sha256_bytes": ".crypto_utils",
+    "hmac_hex": ".crypto_utils", "verify_hmac_hex": ".crypto_utils",
+    "hmac_bytes": ".crypto_utils", "verify_hmac_bytes": ".crypto_utils",
+    # everything below needs ursina/panda3d
+    "resource_path_rel": ".ursina_helpers",
+    "outline_camera_prep": ".camera_outline",
+    "BlenderCamera": ".blender_cam",
+    "TransformAnimator": ".animators", "OneValueAnimator": ".animators",
+    "CameraMan": ".camera_manager", "EditorCamFix": ".camera_manager",
+    "Card": ".card",
+    "GEntity": ".gentity",
+    "LTable": ".lut_tables_2",
+    "SceneManager": ".scene_manager",
+    "ScheduleSeq": ".simple_scheduler",
+    "SceneUI": ".ui",
+}
 
 __all__ = [
-    "vinput", 
+    "vinput",
     "is_valid_e164",
     "DateHelper",
     "ReverseIndex",
-    "ensure_secret_key", "get_secret_key", 
+    "ensure_secret_key", "get_secret_key",
     "hmac_sha256_hex", "verify_hmac_sha256_hex",
     "hmac_sha256_bytes", "verify_hmac_sha256_bytes",
     "hmac_hex", "verify_hmac_hex",
@@ -43,4 +49,18 @@ __all__ = [
     "SceneManager",
     "ScheduleSeq",
     "SceneUI"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """import the owning submodule on first access, then cache on the package"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value # next lookup skips __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,45 @@
+"""CompositionAnalyzer against StrategySolver"""
+import pytest
+
+from blackjack_analyzer import CompositionAnalyzer
+from blackjack_dealer import DealerOutcomes
+from blackjack_rules import Rules
+from blackjack_strategy import StrategySolver, remove_cards, shoe_counts
+
+RULES = (
+    Rules(),
+    Rules(hit_soft_17=True),
+    Rules(double_after_hit=False),
+    Rules(double_on=(9, 10, 11)),
+)
+# (first card, second card, upcard) as value indices, 0 = ace ... 9 = ten
+HANDS = ((5, 2, 9), (6, 3, 5), (0, 5, 4), (9, 3, 1), (2, 2, 0), (1, 4, 6), (0, 6, 9))
+
+
+@pytest.mark.parametrize("rules", RULES, ids=Rules.key)
+def test_exact_mode_matches_the_solver(rules):
+    solver = StrategySolver(rules=rules)
+    analyzer = CompositionAnalyzer(exact=True, rules=rules)
+    for first, second, up in HANDS:
+        hard, ace = first + second + 2, 0 in (first, second)
+        shoe = remove_cards(shoe_counts(1), (first, second, up))
+        expected = solver.action_evs(hard, ace, up, shoe)
+        got = analyzer.action_evs(hard, ace, up, shoe)
+        for action, ev in expected.items():
+            assert got[action] == pytest.approx(ev, abs=1e-12), (first, second, up, action)
+
+
+def test_fast_mode_is_close_on_a_big_shoe():
+    solver = StrategySolver(rules=Rules(decks=8))
+    analyzer = CompositionAnalyzer(rules=Rules(decks=8))
+    for first, second, up in HANDS:
+        hard, ace = first + second + 2, 0 in (first, second)
+        shoe = remove_cards(shoe_counts(8), (first, second, up))
+        expected = solver.action_evs(hard, ace, up, shoe)
+        got = analyzer.action_evs(hard, ace, up, shoe)
+        assert max(abs(got[action] - ev) for action, ev in expected.items()) < 5e-3
+
+
+def test_rules_and_dealer_engine_must_agree():
+    with pytest.raises(ValueError):
+        CompositionAnalyzer(dealer=DealerOutcomes(), rules=Rules(hit_soft_17=True))
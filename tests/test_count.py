@@ -0,0 +1,55 @@
+"""CountTracker against counts recomputed from the dealt cards"""
+import pytest
+
+from blackjack_count import COUNT_SYSTEMS, CountTracker
+from blackjack_rng import make_rng
+from blackjack_shoe import CARDS_PER_DECK, Shoe, card_rank
+from blackjack_strategy import shoe_composition
+
+
+def recount(tracker: CountTracker, shoe: Shoe) -> list[int]:
+    dealt = shoe.cards[:shoe.cursor]
+    return [initial + sum(COUNT_SYSTEMS[name][card_rank(code)] for code in dealt)
+            for name, initial in zip(tracker.systems, tracker._initial)]
+
+
+@pytest.mark.parametrize("decks", (1, 6))
+def test_incremental_counts_match_a_recount(decks):
+    shoe = Shoe(decks, rng=make_rng("fast", decks))
+    tracker = CountTracker(decks)
+    for _ in range(17):
+        shoe.draw() # dealt before the tracker attaches
+    tracker.attach(shoe)
+    for step in range(decks * CARDS_PER_DECK - 17):
+        shoe.draw()
+        if step % 13 == 0:
+            assert tracker.running == recount(tracker, shoe)
+            assert tracker.composition() == shoe_composition(shoe)
+            assert tracker.remaining == len(shoe)
+    assert tracker.running_count("hi_lo") == 0 # balanced: a full shoe nets out
+    assert tracker.running_count("ko") == 4 * sum(COUNT_SYSTEMS["ko"]) # unbalanced: ends on the key count
+
+    shoe.reset()
+    assert tracker.running == list(tracker._initial) and tracker.remaining == decks * CARDS_PER_DECK
+
+
+def test_true_count_and_detach():
+    shoe = Shoe(2, rng=make_rng("fast", 9))
+    tracker = CountTracker(2, ("hi_lo",))
+    tracker.attach(shoe)
+    for _ in range(52):
+        shoe.draw()
+    assert tracker.true_count() == pytest.approx(tracker.running_count() / 1.0)
+    tracker.detach()
+    running = list(tracker.running)
+    shoe.draw()
+    assert tracker.running == running
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        CountTracker(1, ("nope",))
+    with pytest.raises(ValueError):
+        CountTracker(1, {"short": (1, 2)})
+    with pytest.raises(ValueError):
+        CountTracker(2).attach(Shoe(1))
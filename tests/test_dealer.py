@@ -0,0 +1,29 @@
+"""packed shoe keys and the deck cap that keeps them valid"""
+import pytest
+
+from blackjack_dealer import DealerOutcomes, pack_shoe, unpack_shoe
+from blackjack_logic import simulate_cli
+from blackjack_rules import MAX_DECKS, Rules, compile_rules
+from blackjack_strategy import shoe_counts
+
+
+def test_pack_round_trip_up_to_max_decks():
+    for decks in (1, 8, MAX_DECKS):
+        counts = tuple(shoe_counts(decks))
+        assert unpack_shoe(pack_shoe(counts)) == counts
+    with pytest.raises(ValueError):
+        pack_shoe(tuple(shoe_counts(MAX_DECKS + 1)))
+
+
+def test_rules_reject_decks_the_solvers_cant_pack():
+    with pytest.raises(ValueError):
+        compile_rules(Rules(decks=MAX_DECKS + 1))
+    with pytest.raises(SystemExit): # parser.error, not a traceback mid-solve
+        simulate_cli(["--decks", str(MAX_DECKS + 1), "--rounds", "1"])
+
+
+def test_outcomes_sum_to_one():
+    dealer = DealerOutcomes(rules=Rules(decks=MAX_DECKS))
+    full = list(shoe_counts(MAX_DECKS))
+    full[9] -= 1 # ten up
+    assert sum(dealer.outcomes(9, tuple(full))) == pytest.approx(1.0)
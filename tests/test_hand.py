@@ -0,0 +1,33 @@
+"""score_hands() against the scalar check_hand()"""
+import random
+
+import numpy as np
+import pytest
+
+from blackjack_hand import PAD_RANK, hand_ranks, score_hands
+from blackjack_logic import BlackjackLogic
+from blackjack_shoe import CARD_NAMES
+
+
+def random_hands(count: int, seed: int = 0) -> list[list[str]]:
+    rng = random.Random(seed)
+    names = CARD_NAMES + ("??", "1X") # unknown cards score 0 in both
+    return [rng.choices(names, k=rng.randint(0, 9)) for _ in range(count)]
+
+
+def test_score_hands_matches_check_hand():
+    table = BlackjackLogic()
+    hands = random_hands(200_000)
+    totals, soft, busted = score_hands(hand_ranks(hands))
+    for index, cards in enumerate(hands):
+        expected = table.check_hand(cards)
+        assert (totals[index], busted[index]) == (expected["score"], expected["busted"]), cards
+
+
+def test_score_hands_padding_and_errors():
+    totals, soft, busted = score_hands(hand_ranks([["AS", "KD"], []], width=4))
+    assert totals.tolist() == [21, 0] and soft.tolist() == [True, False] and busted.tolist() == [False, False]
+    with pytest.raises(ValueError):
+        score_hands(np.array([1, 2]))
+    with pytest.raises(ValueError):
+        score_hands(np.array([[PAD_RANK - 1]]))
@@ -0,0 +1,17 @@
+"""infinite-deck engine against the finite-shoe one"""
+import pytest
+
+from blackjack_infinite import InfiniteSolver, dealer_max_abs
+from blackjack_rules import Rules
+
+
+@pytest.mark.parametrize("rules", (Rules(), Rules(hit_soft_17=True)), ids=Rules.key)
+def test_dealer_outcomes_are_distributions(rules):
+    solver = InfiniteSolver(rules)
+    for up in range(10):
+        assert sum(solver.dealer_outcomes(up)) == pytest.approx(1.0)
+
+
+def test_dealer_odds_converge_with_shoe_size():
+    one, eight = dealer_max_abs(Rules(decks=1)), dealer_max_abs(Rules(decks=8))
+    assert eight < one and eight < 0.01
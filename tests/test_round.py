@@ -0,0 +1,87 @@
+"""Round state machine: transitions, events, add / remove"""
+import pytest
+
+from blackjack_logic import BlackjackLogic
+from blackjack_rng import make_rng
+from blackjack_round import BETTING, DEALER_TURN, DEALING, PLAYER_TURN, RESOLVED, Round
+from blackjack_shoe import CARD_CODES, Shoe
+from blackjack_trace import Tracer
+
+
+def make_round(names=("A", "B"), seed=0, deck=None) -> Round:
+    logic = BlackjackLogic(rng=make_rng("fast", seed), tracer=Tracer())
+    logic.deck = deck if deck is not None else Shoe(1, rng=logic.rng)
+    players = [logic.seat_player(name, 100) for name in names]
+    return Round(logic, players, logic.seat_dealer("Dealer"))
+
+
+def scripted(*names) -> Shoe:
+    """deal exactly these cards: players, dealer up, players, hole card, then draws"""
+    return Shoe.from_codes([CARD_CODES[name] for name in names])
+
+
+def test_full_round_transitions_and_events():
+    game = make_round(deck=scripted("10S", "9S", "7H", "10C", "8C", "5D", "10D"))
+    states, events = [], []
+    game.on("state", states.append)
+    for name in ("bet", "dealt", "turn", "action", "reveal", "dealer", "result"):
+        game.on(name, lambda *args, name=name: events.append(name))
+    a, b = game.players
+
+    assert game.step(10, b) == BETTING # bets in any order
+    assert game.current is a
+    assert game.step(10) == PLAYER_TURN and game.current is a # 10+10, 9+8
+    assert game.step("stand") == PLAYER_TURN and game.current is b
+    assert game.step("stand") == RESOLVED # dealer, resolution, then waits for new_round()
+    assert states == [DEALING, PLAYER_TURN, PLAYER_TURN, DEALER_TURN, RESOLVED]
+    assert events == ["bet", "bet", "dealt", "turn", "action", "turn", "action",
+                      "reveal", "dealer", "result", "result"]
+    # dealer 7+5 hits a ten and busts: everyone standing wins
+    assert (a.money, b.money) == (110, 110)
+
+    game.new_round()
+    assert game.state == BETTING and game.current is a and not game.bets
+
+
+def test_input_errors():
+    game = make_round()
+    a, b = game.players
+    with pytest.raises(ValueError):
+        game.step(1000) # more than a has
+    game.step(5)
+    with pytest.raises(ValueError):
+        game.step(5, a) # already bet
+    game.step(5, b)
+    if game.state == PLAYER_TURN:
+        other = b if game.current is a else a
+        with pytest.raises(ValueError):
+            game.step("stand", other) # not their turn
+        with pytest.raises(ValueError):
+            game.step("fold")
+    with pytest.raises(ValueError):
+        game.on("nope", print)
+
+
+def test_add_and_remove_while_betting():
+    game = make_round(("A",))
+    logic = game.logic
+    c = logic.seat_player("C", 100)
+    game.add(c)
+    assert game.players[-1] is c
+    game.step(5)
+    assert game.state == BETTING and game.current is c
+    game.remove(c) # the last missing bet leaves: deal to who's left
+    assert c not in game.players
+    assert game.state in (PLAYER_TURN, RESOLVED)
+
+
+def test_add_mid_round_waits_and_remove_stands():
+    game = make_round(deck=scripted("10S", "9S", "7H", "10C", "8C", "5D", "10D"))
+    a, b = game.players
+    game.step(5, a)
+    game.step(5, b)
+    late = game.logic.seat_player("C", 100)
+    game.add(late)
+    assert late not in game.players
+    game.remove(a) # a's turn: stands, play moves on
+    assert a.stand and game.current is b
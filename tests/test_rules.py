@@ -0,0 +1,84 @@
+"""Rules validation, compiled tables and the table using them"""
+import pytest
+
+from blackjack_hand import Hand
+from blackjack_logic import BlackjackLogic
+from blackjack_rng import make_rng
+from blackjack_round import RESOLVED, Round
+from blackjack_rules import Rules, compile_rules
+from blackjack_shoe import CARD_CODES, Shoe
+from blackjack_trace import Tracer
+
+
+@pytest.mark.parametrize("rules", (
+    Rules(decks=0), Rules(decks=2.0), Rules(penetration=0), Rules(penetration=1.2),
+    Rules(decks=1, penetration=0.01), Rules(blackjack_pays=-1), Rules(double_on=[10, 11]),
+    Rules(double_on=(1, 10)),
+))
+def test_invalid_rules(rules):
+    with pytest.raises(ValueError):
+        compile_rules(rules)
+
+
+def test_compiled_once_per_rule_set():
+    assert compile_rules(Rules(decks=2)) is compile_rules(Rules(decks=2))
+    assert compile_rules() is compile_rules(Rules())
+    assert Rules(double_on=(11, 10)).key() == Rules(double_on=(10, 11)).key()
+
+
+def hand(*names) -> Hand:
+    return Hand(CARD_CODES[name] for name in names)
+
+
+def test_dealer_tables():
+    s17, h17 = compile_rules(Rules()), compile_rules(Rules(hit_soft_17=True))
+    for cards, s17_hits, h17_hits in ((("10S", "6S"), True, True), (("AS", "6S"), False, True),
+                                      (("10S", "7S"), False, False), (("AS", "6S", "10S"), False, False),
+                                      (("AS", "AD", "5S"), False, True), (("10S", "6S", "9S"), False, False)):
+        assert s17.dealer_draws(hand(*cards)) is s17_hits, cards
+        assert h17.dealer_draws(hand(*cards)) is h17_hits, cards
+
+
+def test_double_tables():
+    any_time = compile_rules(Rules())
+    assert all(any_time.double_ok[True][4:22]) and all(any_time.double_ok[False][4:22])
+    restricted = compile_rules(Rules(double_on=(10, 11), double_after_hit=False))
+    assert [total for total in range(32) if restricted.double_ok[True][total]] == [10, 11]
+    assert not any(restricted.double_ok[False])
+    assert compile_rules(Rules(blackjack_pays=1.5)).win_payout == (1.0, 1.5)
+
+
+def play(rules: Rules, *cards) -> tuple:
+    """one seat, 10 bet, stand: (player money, dealer cards)"""
+    logic = BlackjackLogic(rng=make_rng("fast", 0), tracer=Tracer(), rules=rules)
+    logic.deck = Shoe.from_codes([CARD_CODES[name] for name in cards])
+    player = logic.seat_player("A", 100)
+    dealer = logic.seat_dealer("Dealer")
+    dealer_cards = []
+    game = Round(logic, [player], dealer)
+    game.on("dealer", lambda dealer: dealer_cards.extend(dealer.cards))
+    game.step(10)
+    while game.state != RESOLVED:
+        game.step("stand")
+    return player.money, dealer_cards
+
+
+def test_table_plays_the_rules():
+    # player 10+8, dealer A+6 then a 2: S17 stands on soft 17, H17 draws to 19
+    assert play(Rules(), "10S", "AH", "8S", "6D", "2C") == (110, ["AH", "6D"])
+    assert play(Rules(hit_soft_17=True), "10S", "AH", "8S", "6D", "2C") == (90, ["AH", "6D", "2C"])
+    # natural against a dealer 17
+    assert play(Rules(blackjack_pays=1.5), "AS", "10H", "KS", "7D")[0] == 115
+
+
+def test_can_double_follows_the_rules():
+    logic = BlackjackLogic(tracer=Tracer(), rules=Rules(double_on=(10, 11), double_after_hit=False))
+    player = logic.seat_player("A", 100)
+    player.bet = 10
+    for cards, score, allowed in ((["5S", "5D"], 10, True), (["5S", "4D"], 9, False), (["2S", "3D", "5C"], 10, False)):
+        player.cards[:] = cards
+        player.score = score
+        assert logic.can_double(player) is allowed, cards
+    player.cards[:] = ["5S", "5D"]
+    player.score, player.bet = 10, 60 # can't cover the double
+    assert not logic.can_double(player)
@@ -0,0 +1,102 @@
+"""Table join / leave / sit-out, and the socket front end"""
+import asyncio
+import json
+
+import pytest
+
+from blackjack_rng import make_rng
+from blackjack_round import BETTING, PLAYER_TURN
+from blackjack_server import Table, TableServer
+
+
+def play_round(table: Table, bets: dict):
+    for player, amount in bets.items():
+        table.handle(player, {"op": "bet", "amount": amount})
+    while table.round.state == PLAYER_TURN:
+        table.handle(table.round.current, {"op": "action", "action": "stand"})
+
+
+@pytest.mark.parametrize("budget", (None, -5, 0, "inf", "nan", "abc"))
+def test_join_rejects_bad_budgets(budget):
+    table = Table("t", decks=1, max_seats=2)
+    with pytest.raises(ValueError):
+        table.join("a", budget, lambda event: None)
+    assert not table.seats
+
+
+def test_join_full_table():
+    table = Table("t", decks=1, max_seats=1)
+    table.join("a", 10, lambda event: None)
+    with pytest.raises(ValueError):
+        table.join("b", 10, lambda event: None)
+
+
+def test_leave_before_the_deal_lets_the_round_go_on():
+    table = Table("t", decks=1, max_seats=2, rng=make_rng("fast", 1))
+    a = table.join("a", 100, lambda event: None)
+    b = table.join("b", 100, lambda event: None)
+    table.handle(a, {"op": "bet", "amount": 5})
+    table.handle(b, {"op": "leave"})
+    assert b not in table.seats and b not in table.round.players
+    assert table.round.state == PLAYER_TURN or table.rounds == 1 # dealt to a alone
+
+
+def test_leave_mid_round_stands_the_seat():
+    table = Table("t", decks=1, max_seats=2, rng=make_rng("fast", 2))
+    a = table.join("a", 100, lambda event: None)
+    b = table.join("b", 100, lambda event: None)
+    for _ in range(50):
+        table.handle(a, {"op": "bet", "amount": 1})
+        table.handle(b, {"op": "bet", "amount": 1})
+        if table.round.state == PLAYER_TURN and table.round.current is a:
+            break
+        play_round(table, {}) # a had a natural, finish and try again
+    else:
+        pytest.fail("no round stopped on a's turn")
+    table.handle(a, {"op": "leave"})
+    assert a not in table.seats
+    while table.round.state == PLAYER_TURN:
+        table.handle(b, {"op": "action", "action": "stand"})
+    assert table.round.state == BETTING and table.round.players == [b]
+
+
+def test_broke_seat_sits_out_and_the_table_keeps_dealing():
+    events = {"a": [], "b": []}
+    table = Table("t", decks=1, max_seats=2, rng=make_rng("fast", 3))
+    a = table.join("a", 10, events["a"].append)
+    b = table.join("b", 1e6, events["b"].append)
+    while a.money > 0:
+        play_round(table, {a: a.money, b: 1})
+    played = table.rounds
+    for _ in range(20):
+        assert table.round.state == BETTING and a not in table.round.players
+        play_round(table, {b: 1})
+    assert table.rounds == played + 20
+    assert [e["message"] for e in events["a"] if e["event"] == "error"] == ["Out of money, sitting out until you leave"]
+    table.handle(a, {"op": "bet", "amount": 1})
+    assert events["a"][-1]["event"] == "error"
+
+
+def test_socket_rejects_null_budget_and_keeps_the_connection():
+    async def run():
+        server = TableServer(decks=1, max_seats=2, rng=make_rng("fast", 4))
+        await server.start(port=0)
+        port = server.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def send(message):
+            writer.write(json.dumps(message).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await asyncio.wait_for(reader.readline(), 5))
+
+        replies = [await send({"op": "join", "budget": None}),
+                   await send({"op": "join", "table": "t1", "name": "ana", "budget": 50})]
+        writer.close()
+        await writer.wait_closed()
+        server.server.close()
+        await server.server.wait_closed()
+        return replies
+
+    rejected, joined = asyncio.run(run())
+    assert rejected["event"] == "error" and "budget" in rejected["message"]
+    assert joined == {"event": "joined", "table": "t1", "name": "ana", "money": 50.0}
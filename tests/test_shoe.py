@@ -0,0 +1,52 @@
+"""Shoe: cut card, in-place reshuffle"""
+from collections import Counter
+
+import pytest
+
+from blackjack_rng import make_rng
+from blackjack_shoe import CARDS_PER_DECK, Shoe
+
+
+def test_full_shoe_deals_every_card_once():
+    shoe = Shoe(2, rng=make_rng("fast", 1))
+    dealt = Counter(shoe.draw() for _ in range(2 * CARDS_PER_DECK))
+    assert dealt == Counter({code: 2 for code in range(CARDS_PER_DECK)})
+    with pytest.raises(IndexError):
+        shoe.draw()
+
+
+def test_cut_card_and_reshuffle():
+    shoe = Shoe(1, rng=make_rng("fast", 2), penetration=0.5)
+    assert shoe.cut == 26 and shoe.penetration == 0.5
+    for _ in range(25):
+        shoe.draw()
+    assert not shoe.cut_reached and not shoe.reshuffle_if_cut()
+    shoe.draw()
+    assert shoe.cut_reached
+    buffer = shoe.cards
+    assert shoe.reshuffle_if_cut()
+    assert len(shoe) == CARDS_PER_DECK and shoe.epoch == 1
+    assert shoe.cards is buffer # same buffer, nothing reallocated
+    assert sorted(shoe.remaining()) == list(range(CARDS_PER_DECK))
+
+
+def test_reset_shuffles_again():
+    shoe = Shoe(1, rng=make_rng("fast", 3))
+    first = [shoe.draw() for _ in range(CARDS_PER_DECK)]
+    shoe.reset()
+    second = [shoe.draw() for _ in range(CARDS_PER_DECK)]
+    assert sorted(first) == sorted(second) and first != second
+
+
+def test_from_codes_deals_in_order_until_reset():
+    shoe = Shoe.from_codes([5, 9, 1], rng=make_rng("fast", 4))
+    assert [shoe.draw() for _ in range(3)] == [5, 9, 1]
+    assert shoe.cut_reached
+    shoe.reset()
+    assert sorted(shoe.draw() for _ in range(3)) == [1, 5, 9]
+
+
+@pytest.mark.parametrize("kwargs", ({"penetration": 0}, {"penetration": 1.5}, {"cut_card": 0}, {"cut_card": 53}))
+def test_bad_cut_card(kwargs):
+    with pytest.raises(ValueError):
+        Shoe(1, **kwargs)
@@ -0,0 +1,11 @@
+"""simulate() reproducibility across worker counts"""
+from blackjack_rules import Rules
+from blackjack_sim import COUNT_KEYS, simulate
+
+
+def test_simulate_independent_of_worker_count():
+    rules = Rules(decks=2, hit_soft_17=True, blackjack_pays=1.5)
+    runs = [simulate(20_000, workers=workers, seats=3, seed=42, block_size=3_000, chunk_size=1_000, rules=rules)
+            for workers in (1, 2, 4)]
+    for run in runs[1:]:
+        assert {key: run[key] for key in COUNT_KEYS} == {key: runs[0][key] for key in COUNT_KEYS}
@@ -0,0 +1,31 @@
+"""simulate CLI argument checks and output"""
+import json
+
+import pytest
+
+from blackjack_logic import simulate_cli
+
+
+@pytest.mark.parametrize("argv", (["--rounds", "0"], ["--chunk", "0"], ["--bet", "0"], ["--bet", "nan"],
+                                  ["--bet", "2e9"], ["--budget", "inf"], ["--seats", "8"],
+                                  ["--penetration", "0.01", "--decks", "1"], ["--double-on", "x"]))
+def test_bad_arguments_exit_through_the_parser(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        simulate_cli(argv)
+    assert exit_info.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+def test_ndjson_rows_per_chunk(tmp_path):
+    out = tmp_path / "rows.ndjson"
+    assert simulate_cli(["--bot", "stand", "--rounds", "250", "--chunk", "100", "--seats", "2",
+                         "--seed", "1", "--out", str(out)]) == 0
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [row["rounds"] for row in rows] == [100, 100, 200, 200, 250, 250]
+    assert {row["seat"] for row in rows} == {"stand1", "stand2"}
+
+
+def test_seat_out_of_money_is_reported(capsys):
+    assert simulate_cli(["--bot", "stand", "--rounds", "1000", "--bet", "10", "--budget", "10",
+                         "--seed", "3"]) == 1
+    assert "can't cover" in capsys.readouterr().err
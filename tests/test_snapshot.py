@@ -0,0 +1,106 @@
+"""Shoe / CountTracker / Round snapshots and the rollout_evs restore invariant"""
+from collections import Counter
+
+import pytest
+
+from blackjack_bots import always_stand, rollout_evs
+from blackjack_count import CountTracker
+from blackjack_journal import RoundRecorder
+from blackjack_logic import BlackjackLogic
+from blackjack_rng import make_rng
+from blackjack_round import PLAYER_TURN, RESOLVED, Round
+from blackjack_shoe import Shoe
+from blackjack_trace import Tracer
+
+
+def state(game: Round) -> tuple:
+    """everything a restore has to bring back, the shoe as a multiset"""
+    deck, counter = game.deck, game.logic.counter
+    return (game.snapshot(), Counter(deck.remaining()), deck.cursor,
+            counter.snapshot() if counter is not None else None)
+
+
+def test_shoe_snapshot_restore_and_epoch():
+    shoe = Shoe(2, rng=make_rng("fast", 1))
+    counter = CountTracker(2)
+    counter.attach(shoe)
+    for _ in range(30):
+        shoe.draw()
+    saved, counted, left = shoe.snapshot(), counter.snapshot(), Counter(shoe.remaining())
+    dealt = shoe.cards[:shoe.cursor]
+    for _ in range(40):
+        shoe.draw()
+    shoe.restore(saved)
+    counter.restore(counted)
+    assert Counter(shoe.remaining()) == left and shoe.cards[:shoe.cursor] == dealt
+    assert counter.remaining == len(shoe)
+
+    shoe.reset()
+    with pytest.raises(ValueError):
+        shoe.restore(saved)
+
+
+def test_put_back_and_take_keep_the_counter_in_step():
+    shoe = Shoe(1, rng=make_rng("fast", 2))
+    counter = CountTracker(1)
+    counter.attach(shoe)
+    codes = [shoe.draw() for _ in range(5)]
+    before = counter.snapshot()
+    shoe.put_back(codes[2])
+    assert len(shoe) == 48 and counter.remaining == 48
+    shoe.take(codes[2])
+    assert counter.snapshot() == before and len(shoe) == 47
+    with pytest.raises(ValueError):
+        shoe.take(codes[0]) # dealt, not in the shoe
+
+
+def make_game(seed: int) -> Round:
+    logic = BlackjackLogic(rng=make_rng("fast", seed), tracer=Tracer(), journal=RoundRecorder(),
+                           counter=CountTracker(1))
+    logic.deck = Shoe(1, rng=logic.rng)
+    logic.attach_counter()
+    players = [logic.seat_player(name, 100) for name in "AB"]
+    return Round(logic, players, logic.seat_dealer("Dealer"))
+
+
+def to_decision(game: Round, seed: int) -> Round:
+    for _ in range(50):
+        game.step(10)
+        game.step(10)
+        if game.state == PLAYER_TURN:
+            return game
+        game.new_round()
+        game.deck.reset()
+    pytest.fail(f"seed {seed} never reached a decision")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_restore_is_exact(seed):
+    game = to_decision(make_game(seed), seed)
+    before = state(game)
+    saved = game.snapshot()
+    while game.state == PLAYER_TURN:
+        game.step("hit")
+    assert game.state == RESOLVED
+    game.restore(saved)
+    assert state(game) == before
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rollout_evs_leaves_the_round_untouched(seed):
+    game = to_decision(make_game(seed), seed)
+    logic = game.logic
+    hooks = (logic.journal, logic.stats, logic.tracer, game.listeners, game.deck.rng)
+    events = logic.journal._events[:]
+    before = state(game)
+
+    evs = rollout_evs(game, always_stand, rollouts=50, rng=make_rng("fast", 99))
+    assert set(evs) <= {"hit", "stand", "double down"} and "stand" in evs
+    assert state(game) == before
+    after = (logic.journal, logic.stats, logic.tracer, game.listeners, game.deck.rng)
+    assert all(mine is theirs for mine, theirs in zip(after, hooks))
+    assert logic.journal._events == events # nothing from the rollouts was journaled
+
+    while game.state == PLAYER_TURN: # and the round still plays on normally
+        game.step("stand")
+    assert game.state == RESOLVED
@@ -0,0 +1,43 @@
+"""RunningStats.merge() against one stream over the same results, StatsRecorder seats"""
+import random
+
+import pytest
+
+from blackjack_bots import always_stand, run_session
+from blackjack_logic import BlackjackLogic
+from blackjack_rng import make_rng
+from blackjack_stats import RunningStats, StatsRecorder
+from blackjack_trace import Tracer
+
+
+def stream(results) -> RunningStats:
+    stats = RunningStats()
+    for x in results:
+        stats.add(x)
+    return stats
+
+
+@pytest.mark.parametrize("cuts", ((0,), (1,), (500,), (1, 2, 3), (10, 250, 999)))
+def test_merge_matches_single_stream(cuts):
+    rng = random.Random(3)
+    results = [rng.choice((-2, -1, -1, 0, 1, 1, 1.5, 2)) for _ in range(1000)]
+    bounds = (0, *cuts, len(results))
+    merged = RunningStats()
+    for start, end in zip(bounds, bounds[1:]):
+        merged.merge(stream(results[start:end]))
+    whole = stream(results)
+
+    for name in ("n", "total", "peak", "trough", "max_drawdown", "low", "high"):
+        assert getattr(merged, name) == getattr(whole, name), name
+    assert merged.mean == pytest.approx(whole.mean, abs=1e-12)
+    assert merged.variance == pytest.approx(whole.variance, rel=1e-12)
+
+
+def test_recorder_keeps_only_player_seats():
+    stats = StatsRecorder()
+    logic = BlackjackLogic(rng=make_rng("fast", 2), tracer=Tracer(), stats=stats)
+    hitter = lambda context: "hit" if context.total < 17 else "stand"
+    run_session({"A": hitter, "B": always_stand}, 2000, decks=1, logic=logic)
+    assert sorted(stats.seats) == ["A", "B"] # dealer busts aren't a seat's result
+    assert stats.rounds == 2000
+    assert all(seat.n == 2000 for seat in stats.seats.values())
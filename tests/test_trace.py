@@ -0,0 +1,33 @@
+"""Tracer ring buffer: order, wrap-around, flush"""
+from blackjack_trace import Tracer
+
+
+class ListSink:
+    def __init__(self):
+        self.events = []
+
+    def write(self, events):
+        self.events.extend(events)
+
+    def close(self):
+        pass
+
+
+def test_flush_delivers_in_order_and_drops_references():
+    sink = ListSink()
+    tracer = Tracer(("action",), (sink,), size=8)
+    for k in range(21): # wraps the ring twice, full rings flush themselves
+        tracer.emit("action", f"P{k}", payload=k)
+        if k == 5:
+            tracer.flush()
+    tracer.flush()
+    assert [event[5] for event in sink.events] == list(range(21))
+    assert tracer.events() == []
+    assert tracer._name == [None] * 8 and tracer._payload == [None] * 8
+
+
+def test_flush_without_events_is_a_no_op():
+    sink = ListSink()
+    tracer = Tracer(sinks=(sink,))
+    tracer.flush()
+    assert sink.events == []